@@ -2,9 +2,7 @@
 
 import sys
 import os
-import hashlib
 import shutil
-import stat
 from datetime import datetime
 import getpass
 from urllib.parse import quote
@@ -12,16 +10,25 @@ import subprocess
 import platform
 import json
 import configparser 
+import threading
+import select
+import re
+from bisect import bisect_right
+
+from duplicateagent_engine import (
+    DEFAULT_HASH_WORKERS, DEFAULT_SCAN_WORKERS, DEFAULT_HASH_ALGORITHM, HASH_ALGORITHM_CHOICES, FAST_HASH_ALGORITHM,
+    ScanEngine, GroupExporter, ScanSession, find_changed_files, format_size
+)
 
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QPushButton, QLineEdit, QLabel, QListWidget, QTableWidget,
-    QTableWidgetItem, QHeaderView, QGroupBox, QCheckBox, QProgressBar,
+    QTableWidgetItem, QTableView, QHeaderView, QGroupBox, QCheckBox, QProgressBar,
     QAbstractItemView, QFileDialog, QMessageBox, QTextEdit,
     QRadioButton, QButtonGroup, QAbstractButton, QTabWidget,
-    QFileIconProvider, QMenu, QScrollArea # QScrollArea eklendi
+    QFileIconProvider, QMenu, QScrollArea, QSpinBox, QComboBox # QScrollArea eklendi
 )
-from PySide6.QtCore import Qt, Signal, Slot, QThread, QLocale, QSize, QFileInfo
+from PySide6.QtCore import Qt, Signal, Slot, QThread, QLocale, QSize, QFileInfo, QAbstractTableModel, QModelIndex
 from PySide6.QtGui import QColor, QBrush, QIcon, QPixmap, QFont
 
 # --- GNOME/Qt Platform Plugin Fix ---
@@ -38,19 +45,6 @@ CURRENT_LANG = DEFAULT_LANG
 # Dil verileri için global değişken
 _texts = {}
 
-# FİLTRE SABİTLERİ Burası sayesinde kullanıcıya uzantı seçtirebiliyoruz. Şimdilik burası sorunsuz çalışıyor görünüyor. Olmazsa Fatihe bir sorayım. 
-EXTENSION_FILTERS = {
-    "all": [],
-    "audio": [".mp3", ".wav", ".flac", ".ogg", ".m4a", ".aac"],
-    "video": [".mp4", ".mkv", ".avi", ".mov", ".wmv", ".flv", ".webm", ".m4v"],
-    "image": [".jpg", ".jpeg", ".png", ".gif", ".bmp", ".tiff", ".webp", ".svg", ".ico", ".raw"],
-    "text": [".txt", ".log", ".md", ".json", ".xml", ".ini", ".conf", ".cfg", ".sh", ".py", ".html", ".css", ".js"],
-    "office": [".doc", ".docx", ".odt", ".xls", ".xlsx", ".ods", ".ppt", ".pptx", ".odp", ".rtf"],
-    "pdf": [".pdf"],
-    "archive": [".zip", ".rar", ".7z", ".tar", ".gz", ".bz2", ".xz", ".tgz"],
-    "custom": []
-}
-
 def load_language_files():
     """INI dosyalarından dil verilerini dinamik olarak yükler."""
     global _texts
@@ -212,13 +206,74 @@ def open_path_in_os(path):
         print(f"HATA: İşletim sistemi komutu bulunamadı.")
         return False
 
+class MountTable:
+    """/proc/self/mountinfo'dan bir kez okunan mount noktası tablosu.
+    Çekirdek bağlama tablosu değiştiğinde dosyayı POLLPRI ile işaretler; tablo yalnızca o zaman yeniden okunur.
+    Yol çözümleme, yolun üst dizinleri boyunca küme aramasıyla (en uzun önek) yapılır, stat çağrısı gerekmez.
+    """
+
+    MOUNTINFO_PATH = '/proc/self/mountinfo'
+
+    def __init__(self):
+        self._mount_points = None
+        self._file = None
+        self._poller = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _unescape(field):
+        # mountinfo boşluk vb. karakterleri \040 gibi sekizlik kaçışlarla yazar
+        return re.sub(r'\\([0-7]{3})', lambda m: chr(int(m.group(1), 8)), field)
+
+    def _load(self):
+        self._file.seek(0)
+        mount_points = set()
+        for line in self._file.read().splitlines():
+            fields = line.split(' ')
+            if len(fields) > 4:
+                mount_points.add(self._unescape(fields[4]))
+        self._mount_points = mount_points
+
+    def _refresh_if_changed(self):
+        """İlk çağrıda tabloyu açar; sonra yalnızca çekirdek değişiklik bildirdiyse yeniden okur."""
+        if self._file is None:
+            self._file = open(self.MOUNTINFO_PATH, 'r', encoding='utf-8', errors='surrogateescape')
+            self._poller = select.poll()
+            self._poller.register(self._file, select.POLLPRI | select.POLLERR)
+            self._load()
+        elif self._poller.poll(0):
+            self._load()
+
+    def resolve(self, path):
+        """Mutlak yolun mount noktasını döndürür. Tablo okunamıyorsa None döner."""
+        with self._lock:
+            try:
+                self._refresh_if_changed()
+            except (OSError, AttributeError):
+                return None # /proc yok (Linux dışı) veya select.poll desteklenmiyor
+
+            while path not in self._mount_points:
+                parent = os.path.dirname(path)
+                if parent == path: # Kök dizine ulaştık
+                    break
+                path = parent
+            return path
+
+_MOUNT_TABLE = MountTable()
+
 # <<< YENİ METOT: DOSYANIN BULUNDUĞU DİSKİ (MOUNT NOKTASINI) BULMA >>>
 def get_mount_point(path):
     """Verilen dosya yolunun bağlı olduğu mount noktasını bulur. 
-    Linux/Unix sistemlerde temel olarak os.path.ismount() kullanır.
+    Linux'ta önbelleklenmiş /proc/self/mountinfo tablosunu kullanır (MountTable);
+    tablo yoksa (Darwin vb.) os.path.ismount() ile yukarı doğru yürür.
     Diğer sistemlerde basitçe kök dizini veya sürücü harfini döndürür.
     """
     path = os.path.abspath(path)
+    if platform.system() == "Linux":
+        mount_point = _MOUNT_TABLE.resolve(path)
+        if mount_point is not None:
+            return mount_point
+
     if platform.system() == "Linux" or platform.system() == "Darwin":
         while not os.path.ismount(path):
             parent = os.path.dirname(path)
@@ -243,166 +298,38 @@ def get_mount_point(path):
 # 1. HASH VE TARAMA MANTIĞI
 # ----------------------------------------------------------------------
 
-def calculate_md5(filepath, chunk_size=4096):
-    """Büyük dosyalar için belleği yormadan MD5 hash'ini hesaplar."""
-    hasher = hashlib.md5()
-    try:
-        with open(filepath, 'rb') as file:
-            while True:
-                chunk = file.read(chunk_size)
-                if not chunk:
-                    break
-                hasher.update(chunk)
-        return hasher.hexdigest()
-    except IOError:
-        return None
-
-def format_size(size):
-    """Bayt cinsinden boyutu okunabilir formata çevirir."""
-    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-        if size < 1024.0:
-            return f"{size:3.1f} {unit}"
-        size /= 1024.0
-    return f"{size:3.1f} PB"
-# MD5 neden gerekli: kullanıcı dosya adını değiştirdi ama içerik aynı. Bunu programın akıllı biçimde göstermesi gerekir. 
-
 class WorkerThread(QThread):
+    """ScanEngine'i (duplicateagent_engine) arka planda çalıştırır; geri çağırmaları Qt sinyallerine,
+    durum anahtarlarını seçili dildeki metinlere çevirir.
+    """
     progress_updated = Signal(int)
     status_message = Signal(str)
-    scan_finished = Signal(list)
+    group_found = Signal(dict) # Son üyesi hash'lenen her kopya grubu anında gönderilir
+    scan_finished = Signal(list) # Yalnızca group_found ile gönderilmemiş gruplar (sabit bağ grupları)
+    group_updated = Signal(dict) # İzleme kipinde üyeleri değişen grubun güncel hali (2'den az dosya = grup kalktı)
 
     def __init__(self, target_dirs, options, parent=None):
         super().__init__(parent)
         self.target_dirs = target_dirs
         self.options = options
-        self._is_running = True
-
-    def run(self):
-        # --- FİLTRELEME İŞLEMİNİN HAZIRLANMASI BAŞLANGICI ---
-        file_filters = self.options["filter"]
-        allowed_extensions = set()
-        custom_extensions_raw = file_filters.get("custom_extensions", "").strip()
-
-        selected_filter_key = "all"
-        filter_keys = ["audio", "video", "image", "text", "office", "pdf", "archive", "custom"]
-        if file_filters.get("all") == True:
-            selected_filter_key = "all"
-        else:
-            for key in filter_keys:
-                if file_filters.get(key) == True:
-                    selected_filter_key = key
-                    break
-        
-        if selected_filter_key != "all" and selected_filter_key != "custom":
-            allowed_extensions.update(EXTENSION_FILTERS.get(selected_filter_key, []))
-            
-        if selected_filter_key == "custom" and custom_extensions_raw:
-            for ext in custom_extensions_raw.lower().replace(" ", "").split(','):
-                if ext:
-                    if not ext.startswith('.'):
-                        ext = '.' + ext
-                    allowed_extensions.add(ext)
-
-        allowed_extensions = {ext.lower() for ext in allowed_extensions}
-        is_filtering_active = selected_filter_key != "all" and bool(allowed_extensions)
-        # --- FİLTRELEME İŞLEMİNİN HAZIRLANMASI SONU --- Buraya şimdilik ellemeyelim düzgün çalışıyor.
-
-        self.status_message.emit(get_text("status_scanning"))
-        all_files_by_size = {}
-        total_files = 0
-
-        for base_dir in self.target_dirs:
-            if not self._is_running: return
-
-            for root, dirs, files in os.walk(base_dir):
-                if not self._is_running: return
-
-                for file_name in files:
-                    full_path = os.path.join(root, file_name)
-
-                    try:
-                        file_stats = os.stat(full_path)
-                        file_size = file_stats.st_size
-                    except:
-                        continue
-
-                    if self.options["ignore"]["ignore_zero_byte"] and file_size == 0:
-                        continue
-                    if self.options["ignore"]["ignore_system_hidden"] and file_name.startswith('.'):
-                        continue
-
-                    # --- UZANTI FİLTRELEME UYGULAMASI ---
-                    if is_filtering_active:
-                        file_ext = os.path.splitext(file_name)[1].lower()
-                        if file_ext not in allowed_extensions:
-                            continue
-                    # --- UZANTI FİLTRELEME UYGULAMASI SONU ---
-
-                    if file_size not in all_files_by_size:
-                        all_files_by_size[file_size] = []
-                    all_files_by_size[file_size].append(full_path)
-                    total_files += 1
-
-        candidate_groups = {size: paths for size, paths in all_files_by_size.items() if len(paths) > 1}
-        total_candidates = sum(len(paths) for paths in candidate_groups.values())
-
-        if total_candidates == 0:
-            self.status_message.emit(get_text("status_finished_none").format(total_files))
-            self.scan_finished.emit([])
-            return
-
-        self.status_message.emit(get_text("status_hashing").format(total_candidates))
-
-        files_by_hash = {}
-        processed_count = 0
-
-        for size, file_paths in candidate_groups.items():
-            for file_path in file_paths:
-                if not self._is_running: return
-
-                processed_count += 1
-                progress = int((processed_count / total_candidates) * 100)
-                self.progress_updated.emit(progress)
-                self.status_message.emit(get_text("status_hashing_file").format(os.path.basename(file_path)))
-
-                file_hash = calculate_md5(file_path)
-
-                if not file_hash:
-                    continue
-
-                if self.options["match"]["name"]:
-                    file_hash = f"{file_hash}-{os.path.basename(file_path)}"
-
-                if self.options["match"]["extension"]:
-                    file_name, file_ext = os.path.splitext(os.path.basename(file_path))
-                    file_hash = f"{file_hash}-{file_ext.lower()}"
-
-                if file_hash:
-                    if file_hash not in files_by_hash:
-                        files_by_hash[file_hash] = []
-                    files_by_hash[file_hash].append(file_path)
-
-        final_duplicates = []
-        for file_hash, file_paths in files_by_hash.items():
-            if len(file_paths) > 1:
-                try:
-                    file_size_bytes = os.stat(file_paths[0]).st_size
-                    final_duplicates.append({
-                        "hash": file_hash,
-                        "size_bytes": file_size_bytes, 
-                        "size": format_size(file_size_bytes),
-                        "files": file_paths
-                    })
-                except:
-                    continue
+        self.engine = ScanEngine(
+            target_dirs, options,
+            on_progress=self.progress_updated.emit,
+            on_status=lambda key, *args: self.status_message.emit(get_text(key).format(*args)),
+            on_group=self.group_found.emit,
+            on_finished=self.scan_finished.emit,
+            on_group_updated=self.group_updated.emit
+        )
 
-        self.status_message.emit(get_text("status_finished").format(len(final_duplicates)))
+    @property
+    def watching(self):
+        return self.engine.watching
 
-        self.progress_updated.emit(100)
-        self.scan_finished.emit(final_duplicates)
+    def run(self):
+        self.engine.run()
 
     def stop(self):
-        self._is_running = False
+        self.engine.stop()
 
 # ----------------------------------------------------------------------
 # 2. FAKE TRASH YÖNETİM SINIFI 
@@ -411,11 +338,29 @@ class WorkerThread(QThread):
 # ----------------------------------------------------------------------
 
 class FakeTrashManager:
-    """Sahte Çöp Kutusu dizinlerini ve metadata dosyasını DİSK BAZLI yönetir."""
+    """Sahte Çöp Kutusu dizinlerini ve metadata dosyasını DİSK BAZLI yönetir.
+    Metadata, yalnızca sonuna eklenen bir JSON-lines günlüğüdür (trashdata.jsonl): her taşıma bir "add",
+    her geri yükleme/kalıcı silme bir "remove" kaydı ekler, yani işlem başına G/Ç sabittir.
+    Ölü kayıtlar çoğalmışsa günlük yazan tarafta (taşıma/geri yükleme/silme toplu işleminin sonunda) atomik
+    olarak sıkıştırılır; okuma yolu günlüğü hiç değiştirmez. Ekleme ve sıkıştırma aynı günlük kilidini paylaşır,
+    böylece arka plandaki bir ekleme os.replace ile kaybolmaz. Yarıda kalmış son satır yok sayılır.
+    """
+
+    METADATA_FILE = 'trashdata.jsonl'
+    LEGACY_METADATA_FILE = 'trashdata.json' # 0.9.x öncesi tek parça JSON dizisi
+    COMPACT_MIN_RECORDS = 1000 # Bundan az kayıtlı günlükler sıkıştırılmaz
+    SYNC_EVERY_RECORDS = 100 # Toplu taşımada günlük bu kadar kayıtta bir diske indirilir (fsync)
 
     def __init__(self):
         # Artık global bir çöp dizini yönetmiyoruz. Sadece yapılandırma dosya tabanını tutalım.
         self.base_config_dir = os.path.join(os.path.expanduser('~'), '.duplicateagent')
+        self._journal_locks = {} # metadata yolu -> threading.Lock
+        self._journal_locks_guard = threading.Lock()
+
+    def _journal_lock(self, metadata_path):
+        """Bir günlüğe ekleyen ve onu sıkıştıran kodun paylaştığı kilidi döndürür."""
+        with self._journal_locks_guard:
+            return self._journal_locks.setdefault(metadata_path, threading.Lock())
 
     def _get_trash_paths(self, filepath):
         """Dosyanın bulunduğu diske (mount noktasına) göre çöp dizini ve metadata yollarını döndürür."""
@@ -427,83 +372,215 @@ class FakeTrashManager:
         trash_dir = os.path.join(mount_point, '.Trash-DuplicateAgent')
         
         # Meta veri dosyası da aynı dizinde olacak
-        metadata_path = os.path.join(trash_dir, 'trashdata.json')
+        metadata_path = os.path.join(trash_dir, self.METADATA_FILE)
         
         return trash_dir, metadata_path
 
     def _setup_disk_dirs(self, trash_dir):
-        """Belirtilen diske ait çöp dizinini ve metadata dosyasını oluşturur."""
-        metadata_path = os.path.join(trash_dir, 'trashdata.json')
+        """Belirtilen diske ait çöp dizinini oluşturur, eski biçimli metadata varsa günlüğe dönüştürür."""
         try:
             os.makedirs(trash_dir, exist_ok=True)
-            if not os.path.exists(metadata_path):
-                with open(metadata_path, 'w', encoding='utf-8') as f:
-                    json.dump([], f, indent=4)
+            self._migrate_legacy_metadata(trash_dir)
         except Exception as e:
             print(f"HATA: Disk Bazlı Fake Trash dizinleri oluşturulamadı: {e}")
 
+    def _migrate_legacy_metadata(self, trash_dir):
+        """Eski trashdata.json dizisini tek seferde günlük biçimine çevirir ve eski dosyayı siler."""
+        legacy_path = os.path.join(trash_dir, self.LEGACY_METADATA_FILE)
+        metadata_path = os.path.join(trash_dir, self.METADATA_FILE)
+        if not os.path.exists(legacy_path):
+            return
+        with self._journal_lock(metadata_path):
+            if os.path.exists(metadata_path):
+                return
+            try:
+                with open(legacy_path, 'r', encoding='utf-8') as f:
+                    legacy_data = json.load(f)
+            except (OSError, json.JSONDecodeError):
+                legacy_data = []
+            if self._save_metadata(legacy_data, metadata_path):
+                os.remove(legacy_path)
+
+    def get_disk_entries(self, trash_dir):
+        """Bir çöp dizinindeki güncel kayıtları döndürür; dizin yoksa boş liste."""
+        if not os.path.isdir(trash_dir):
+            return []
+        self._migrate_legacy_metadata(trash_dir)
+        return self._load_metadata(os.path.join(trash_dir, self.METADATA_FILE))
+
+    @staticmethod
+    def _entry_key(item):
+        return (item.get("trash_filename"), item.get("original_path"))
+
     def _load_metadata(self, metadata_path):
-        """Belirtilen metadata dosyasını okur ve JSON listesi döndürür."""
+        """Günlüğü baştan oynatır ve güncel kayıt listesini döndürür (ekleme sırasıyla). Bozuk/yarım satırlar atlanır."""
+        return self._replay_metadata(metadata_path)[0]
+
+    def _replay_metadata(self, metadata_path):
+        """(güncel kayıtlar, günlükteki geçerli satır sayısı) döndürür."""
+        live_entries = {}
+        record_count = 0
         try:
             with open(metadata_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
-            return []
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue # Çökme anında yarım kalmış satır
+                    record_count += 1
+                    op = record.pop("op", "add")
+                    if op == "add":
+                        live_entries[self._entry_key(record)] = record
+                    elif op == "remove":
+                        live_entries.pop(self._entry_key(record), None)
+        except FileNotFoundError:
+            return [], 0
+        return list(live_entries.values()), record_count
+
+    def compact_metadata(self, trash_dir):
+        """Ölü kayıtlar (silinmiş öğelerin "add" kayıtları ve "remove" kayıtları) canlı kayıtların iki katını
+        aşarsa günlüğü sıkıştırır. Yalnızca yazan taraftan,
+        bir toplu işlemin sonunda çağrılır; kilit tutulduğu için arada başka bir ekleme yapılamaz.
+        """
+        metadata_path = os.path.join(trash_dir, self.METADATA_FILE)
+        with self._journal_lock(metadata_path):
+            data, record_count = self._replay_metadata(metadata_path)
+            if record_count >= self.COMPACT_MIN_RECORDS and record_count - len(data) > 2 * len(data):
+                self._save_metadata(data, metadata_path)
 
     def _save_metadata(self, data, metadata_path):
-        """Metadata listesini belirtilen dosyaya yazar."""
+        """Kayıt listesini sıkıştırılmış günlük olarak atomik yazar (geçici dosya + fsync + os.replace)."""
+        temp_path = metadata_path + '.tmp'
         try:
-            with open(metadata_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=4)
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                for item in data:
+                    f.write(json.dumps(dict(item, op="add"), ensure_ascii=False) + '\n')
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, metadata_path)
             return True
         except Exception as e:
             print(f"HATA: Metadata yazılamadı: {e}")
             return False
 
-    def move_to_trash(self, filepath, file_size_bytes):
-        """Dosyayı kendi diskindeki FakeTrash'a taşır ve metadata kaydını oluşturur."""
-        original_path = os.path.abspath(filepath)
-        
-        # 1. Disk yollarını al ve dizini kur
-        trash_dir, metadata_path = self._get_trash_paths(original_path)
-        self._setup_disk_dirs(trash_dir) # Dizin ve metadata dosyasını oluşturur
-        
-        target_filename = os.path.basename(original_path)
-        
-        # Benzersiz dosya adı oluşturma 
-        counter = 0
-        name, ext = os.path.splitext(target_filename)
-        postfix = int(datetime.now().timestamp() * 1000) 
-        trash_filename = f"{name}_{postfix}{ext}"
-
-        while os.path.exists(os.path.join(trash_dir, trash_filename)):
-            counter += 1
-            trash_filename = f"{name}_{postfix}_{counter}{ext}"
-
-        target_path = os.path.join(trash_dir, trash_filename)
-        
+    def _append_metadata(self, records, metadata_path, sync=True):
+        """Kayıtları günlüğün sonuna ekler; sync ise diske de indirir (fsync). Önceki yazım yarıda kalmışsa yeni satırdan başlar.
+        sync=False olsa da kayıt işletim sistemine yazılmıştır; süreç çökse bile kaybolmaz, yalnızca güç kesintisine açıktır.
+        """
         try:
-            # Aynı diskte olduğu için hızlı taşıma
-            shutil.move(original_path, target_path)
-
-            # Metadata güncelle
-            metadata = self._load_metadata(metadata_path)
-            new_entry = {
-                "trash_filename": trash_filename,
-                "original_path": original_path,
-                "deletion_date": datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                "size": format_size(file_size_bytes),
-                "size_bytes": file_size_bytes,
-                "trash_dir": trash_dir # Hangi çöp dizininde olduğunu saklayalım.
-            }
-            metadata.append(new_entry)
-            self._save_metadata(metadata, metadata_path)
-            
+            with self._journal_lock(metadata_path), open(metadata_path, 'a+b') as f:
+                if f.tell() > 0:
+                    f.seek(-1, os.SEEK_END)
+                    if f.read(1) != b'\n':
+                        f.write(b'\n')
+                f.write(''.join(json.dumps(record, ensure_ascii=False) + '\n' for record in records).encode('utf-8'))
+                f.flush()
+                if sync:
+                    os.fsync(f.fileno())
             return True
         except Exception as e:
-            print(f"Taşıma Hatası (Disk Bazlı): {e}")
+            print(f"HATA: Metadata yazılamadı: {e}")
             return False
 
+    def _sync_metadata(self, metadata_path):
+        """sync=False ile eklenmiş kayıtları diske indirir."""
+        try:
+            with self._journal_lock(metadata_path), open(metadata_path, 'rb') as f:
+                os.fsync(f.fileno())
+        except OSError as e:
+            print(f"HATA: Metadata yazılamadı: {e}")
+
+    def move_to_trash(self, filepath, file_size_bytes):
+        """Dosyayı kendi diskindeki FakeTrash'a taşır ve metadata kaydını oluşturur."""
+        moved_paths, failed_paths = self.move_many_to_trash([{"path": filepath, "size_bytes": file_size_bytes}])
+        return bool(moved_paths)
+
+    def move_many_to_trash(self, files, on_file_done=None, should_continue=None, should_move=None):
+        """Dosyaları ({"path", "size_bytes"} listesi) kendi disklerindeki FakeTrash'a toplu taşır.
+        Dosyalar mount noktasına göre gruplanır; her disk için dizin kurulumu bir kez yapılır. Her taşımanın
+        günlük kaydı taşımadan hemen sonra eklenir (işlem yarıda çökse bile çöpteki her dosyanın kaydı vardır);
+        fsync SYNC_EVERY_RECORDS kayıtta bir ve disk bitince yapılır. (taşınan_yollar, başarısız_yollar) döndürür;
+        yollar çağırana verildiği biçimiyle döner.
+        on_file_done(yol, başarılı) her dosyadan sonra çağrılır. should_continue() False dönerse kalan
+        dosyalar atlanır; o ana kadar taşınanların metadata kaydı yine de yazılır.
+        should_move(dosya_sözlüğü) taşımadan hemen önce çağrılır; False dönerse dosya taşınmaz ve başarısız sayılır.
+        """
+        files_by_trash_dir = {}
+        for file_data in files:
+            original_path = os.path.abspath(file_data["path"])
+            trash_dir, metadata_path = self._get_trash_paths(original_path)
+            if trash_dir not in files_by_trash_dir:
+                files_by_trash_dir[trash_dir] = (metadata_path, [])
+            files_by_trash_dir[trash_dir][1].append((file_data, original_path))
+
+        moved_paths = []
+        failed_paths = []
+
+        for trash_dir, (metadata_path, disk_files) in files_by_trash_dir.items():
+            # 1. Dizin ve metadata dosyasını disk başına bir kez kur
+            self._setup_disk_dirs(trash_dir)
+            appended_count = 0
+
+            for file_data, original_path in disk_files:
+                if should_continue and not should_continue():
+                    break
+
+                input_path, file_size_bytes = file_data["path"], file_data["size_bytes"]
+                if should_move and not should_move(file_data):
+                    failed_paths.append(input_path)
+                    if on_file_done:
+                        on_file_done(input_path, False)
+                    continue
+
+                target_filename = os.path.basename(original_path)
+
+                # Benzersiz dosya adı oluşturma 
+                counter = 0
+                name, ext = os.path.splitext(target_filename)
+                postfix = int(datetime.now().timestamp() * 1000) 
+                trash_filename = f"{name}_{postfix}{ext}"
+
+                while os.path.exists(os.path.join(trash_dir, trash_filename)):
+                    counter += 1
+                    trash_filename = f"{name}_{postfix}_{counter}{ext}"
+
+                target_path = os.path.join(trash_dir, trash_filename)
+
+                try:
+                    # Aynı diskte olduğu için hızlı taşıma
+                    shutil.move(original_path, target_path)
+                except Exception as e:
+                    print(f"Taşıma Hatası (Disk Bazlı): {e}")
+                    failed_paths.append(input_path)
+                    if on_file_done:
+                        on_file_done(input_path, False)
+                    continue
+
+                # 2. Günlük kaydı taşımanın hemen ardından (fsync her SYNC_EVERY_RECORDS kayıtta bir)
+                appended_count += 1
+                self._append_metadata([{
+                    "op": "add",
+                    "trash_filename": trash_filename,
+                    "original_path": original_path,
+                    "deletion_date": datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+                    "size": format_size(file_size_bytes),
+                    "size_bytes": file_size_bytes,
+                    "trash_dir": trash_dir # Hangi çöp dizininde olduğunu saklayalım.
+                }], metadata_path, sync=appended_count % self.SYNC_EVERY_RECORDS == 0)
+                moved_paths.append(input_path)
+                if on_file_done:
+                    on_file_done(input_path, True)
+
+            if appended_count:
+                if appended_count % self.SYNC_EVERY_RECORDS:
+                    self._sync_metadata(metadata_path)
+                self.compact_metadata(trash_dir)
+
+            if should_continue and not should_continue():
+                break
+
+        return moved_paths, failed_paths
+
     def get_trash_files(self):
         """Bu metod artık kullanılmayacak veya FakeTrashApp tarafından yönetilecek."""
         raise NotImplementedError("Disk bazlı yönetim nedeniyle bu metot artık DuplicateFinderApp tarafından yönetilmelidir.")
@@ -511,7 +588,7 @@ class FakeTrashManager:
     def restore_file(self, trash_filename, original_path, trash_dir):
         """Dosyayı FakeTrash'tan orijinal konumuna geri yükler (trash_dir parametresi eklendi)."""
         trash_file_path = os.path.join(trash_dir, trash_filename)
-        metadata_path = os.path.join(trash_dir, 'trashdata.json')
+        metadata_path = os.path.join(trash_dir, self.METADATA_FILE)
         
         if not os.path.exists(trash_file_path):
             return False 
@@ -525,9 +602,7 @@ class FakeTrashManager:
             shutil.move(trash_file_path, original_path)
 
             # Metadata kaydını sil
-            metadata = self._load_metadata(metadata_path)
-            metadata = [item for item in metadata if not (item["trash_filename"] == trash_filename and item["original_path"] == original_path)]
-            self._save_metadata(metadata, metadata_path)
+            self._append_metadata([{"op": "remove", "trash_filename": trash_filename, "original_path": original_path}], metadata_path)
             
             return True
         except Exception as e:
@@ -537,16 +612,14 @@ class FakeTrashManager:
     def purge_file(self, trash_filename, original_path, trash_dir):
         """Dosyayı FakeTrash'tan kalıcı olarak siler (diskten siler)."""
         trash_file_path = os.path.join(trash_dir, trash_filename)
-        metadata_path = os.path.join(trash_dir, 'trashdata.json')
+        metadata_path = os.path.join(trash_dir, self.METADATA_FILE)
         
         try:
             if os.path.exists(trash_file_path):
                 os.remove(trash_file_path)
 
             # Metadata kaydını sil
-            metadata = self._load_metadata(metadata_path)
-            metadata = [item for item in metadata if not (item["trash_filename"] == trash_filename and item["original_path"] == original_path)]
-            self._save_metadata(metadata, metadata_path)
+            self._append_metadata([{"op": "remove", "trash_filename": trash_filename, "original_path": original_path}], metadata_path)
             
             return True
         except Exception as e:
@@ -554,13 +627,331 @@ class FakeTrashManager:
             return False
 
 
+class TrashOperationThread(QThread):
+    """Çöpe taşıma, geri yükleme ve kalıcı silme işlemlerini arayüzü dondurmadan arka planda yürütür.
+    operation: "move" (items: {"path", "size_bytes"}) veya "restore"/"purge"
+    (items: {"trash_filename", "original_path", "trash_dir"}).
+    "move" öğelerinde isteğe bağlı "stat" (taramadaki anlık görüntü) ve "kept" (grubun korunan kopyaları,
+    [(yol, stat)]) varsa her dosya taşınmadan hemen önce yeniden doğrulanır: kendisi değiştiyse ya da grubun
+    korunan kopyalarının hepsi değiştiyse taşınmaz, başarısız sayılır ve changed_paths'e eklenir.
+    Bitince operation_finished(operation, [(yol, başarılı), ...]) gönderilir; iptal edilirse
+    işlenmemiş dosyalar listede yer almaz.
+    """
+    progress_updated = Signal(int)
+    status_message = Signal(str)
+    operation_finished = Signal(str, list)
+
+    def __init__(self, trash_manager, operation, items, parent=None):
+        super().__init__(parent)
+        self.trash_manager = trash_manager
+        self.operation = operation
+        self.items = items
+        self.results = []
+        self.changed_paths = [] # Taramadan sonra değiştiği için taşınmayan dosyalar
+        self._kept_changed = {} # id(kept listesi) -> korunan kopyaların hepsi değişti mi (grup başına bir kez bakılır)
+        self._is_running = True
+
+    def _unchanged_since_scan(self, file_data):
+        """Dosya ve grubunun korunan kopyaları taramadaki halindeyse True döndürür."""
+        changed = bool(find_changed_files([(file_data["path"], file_data.get("stat"))]))
+        kept_files = file_data.get("kept")
+        if not changed and kept_files:
+            if id(kept_files) not in self._kept_changed:
+                self._kept_changed[id(kept_files)] = len(find_changed_files(kept_files)) == len(kept_files)
+            changed = self._kept_changed[id(kept_files)]
+        if changed:
+            self.changed_paths.append(file_data["path"])
+        return not changed
+
+    def run(self):
+        total = len(self.items)
+
+        def on_file_done(file_path, ok):
+            self.results.append((file_path, ok))
+            self.progress_updated.emit(int((len(self.results) / total) * 100))
+            self.status_message.emit(get_text("status_hashing_file").format(os.path.basename(file_path)))
+
+        if self.operation == "move":
+            self.trash_manager.move_many_to_trash(self.items, on_file_done, lambda: self._is_running, self._unchanged_since_scan)
+        else:
+            operation_func = self.trash_manager.restore_file if self.operation == "restore" else self.trash_manager.purge_file
+            touched_trash_dirs = set()
+            for file_data in self.items:
+                if not self._is_running:
+                    break
+                ok = operation_func(file_data["trash_filename"], file_data["original_path"], file_data["trash_dir"])
+                touched_trash_dirs.add(file_data["trash_dir"])
+                on_file_done(file_data["original_path"], ok)
+            # "remove" kayıtlarıyla büyüyen günlükler toplu işlemin sonunda, disk başına bir kez sıkıştırılır
+            for trash_dir in touched_trash_dirs:
+                self.trash_manager.compact_metadata(trash_dir)
+
+        self.operation_finished.emit(self.operation, self.results)
+
+    def stop(self):
+        self._is_running = False
+
+# ----------------------------------------------------------------------
+# 3. SONUÇ TABLOSU MODELİ
+# Yüz binlerce satırda QTableWidgetItem üretmek dakikalar sürüyordu; model satırları yalnızca görünürken çizer.
+# ----------------------------------------------------------------------
+
+class DuplicateResultsModel(QAbstractTableModel):
+    """duplicate_data gruplarının üzerinde sanal tablo modeli.
+    Satır -> (grup, dosya) eşlemesi grupların başlangıç satırları üzerinde ikili aramayla bulunur;
+    satır başına yalnızca bir işaret baytı tutulur.
+    Sütunlar: 0 işaret kutusu, 1 dosya adı (ikonlu), 2 klasör yolu, 3 boyut.
+    """
+
+    COL_CHECK, COL_NAME, COL_PATH, COL_SIZE = range(4)
+
+    def __init__(self, group_colors, linked_color, icon_func, parent=None):
+        super().__init__(parent)
+        self.group_colors = [QBrush(color) for color in group_colors]
+        self.linked_brush = QBrush(linked_color)
+        self.icon_func = icon_func
+        self.linked_tooltip = ""
+        self._headers = ["", "", "", ""]
+        self.groups = [] # Hep aynı liste nesnesi; DuplicateFinderApp.duplicate_data bunu gösterir
+        self.clear()
+
+    def clear(self):
+        self.beginResetModel()
+        self.groups.clear()
+        self._group_starts = [] # Her grubun ilk satır numarası (artan sırada)
+        self._checks = [] # Her grup için dosya başına işaret durumu (bytearray)
+        self._group_index_by_hash = {} # Canlı izleme güncellemeleri için hash -> grup indeksi (sabit bağ grupları hariç)
+        self._row_count = 0
+        self.endResetModel()
+
+    def set_headers(self, headers):
+        self._headers = list(headers)
+        self.headerDataChanged.emit(Qt.Horizontal, 0, len(self._headers) - 1)
+
+    # --- Model arabirimi ---
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._row_count
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else 4
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole and section < len(self._headers):
+            return self._headers[section]
+        return super().headerData(section, orientation, role)
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        if index.column() == self.COL_CHECK:
+            return Qt.ItemIsUserCheckable | Qt.ItemIsEnabled
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        group_index, file_index = self.locate(index.row())
+        group = self.groups[group_index]
+        file_path = group["files"][file_index]
+        column = index.column()
+
+        if role == Qt.DisplayRole:
+            if column == self.COL_NAME:
+                return os.path.basename(file_path)
+            if column == self.COL_PATH:
+                return os.path.dirname(file_path) + os.path.sep
+            if column == self.COL_SIZE:
+                return group["size"] # Okunabilir boyut
+        elif role == Qt.CheckStateRole and column == self.COL_CHECK:
+            return Qt.CheckState.Checked if self._checks[group_index][file_index] else Qt.CheckState.Unchecked
+        elif role == Qt.DecorationRole and column == self.COL_NAME:
+            return self.icon_func(file_path)
+        elif role == Qt.BackgroundRole:
+            if group.get("linked", False):
+                return self.linked_brush
+            return self.group_colors[group_index % len(self.group_colors)]
+        elif role == Qt.ToolTipRole and column == self.COL_SIZE and group.get("linked", False):
+            return self.linked_tooltip
+        elif role == Qt.UserRole:
+            return group["size_bytes"]
+        elif role == Qt.UserRole + 1:
+            return group["hash"]
+        return None
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if not index.isValid() or role != Qt.CheckStateRole or index.column() != self.COL_CHECK:
+            return False
+        group_index, file_index = self.locate(index.row())
+        self._checks[group_index][file_index] = 1 if Qt.CheckState(value) == Qt.CheckState.Checked else 0
+        self.dataChanged.emit(index, index, [Qt.CheckStateRole])
+        return True
+
+    # --- Yardımcılar ---
+
+    def locate(self, row):
+        """Satır numarasını (grup_indeksi, dosya_indeksi) çiftine çevirir."""
+        group_index = bisect_right(self._group_starts, row) - 1
+        return group_index, row - self._group_starts[group_index]
+
+    def file_path(self, row):
+        group_index, file_index = self.locate(row)
+        return self.groups[group_index]["files"][file_index]
+
+    def append_groups(self, groups):
+        """Grupları sona ekler. İlk dosya korunur, diğerleri işaretli gelir; sabit bağ gruplarında hiçbiri işaretlenmez."""
+        new_rows = sum(len(group["files"]) for group in groups)
+        if new_rows == 0:
+            return
+        self.beginInsertRows(QModelIndex(), self._row_count, self._row_count + new_rows - 1)
+        for group in groups:
+            file_count = len(group["files"])
+            if file_count == 0:
+                continue
+            checks = bytearray(file_count)
+            if not group.get("linked", False):
+                checks[1:] = b"\x01" * (file_count - 1)
+            if not group.get("linked", False):
+                self._group_index_by_hash[group["hash"]] = len(self.groups)
+            self.groups.append(group)
+            self._group_starts.append(self._row_count)
+            self._checks.append(checks)
+            self._row_count += file_count
+        self.endInsertRows()
+
+    def checked_files(self):
+        """İşaretli dosyaları {"path", "size_bytes", "stat", "group"} sözlükleri olarak döndürür; "stat" taramadaki
+        (st_dev, st_ino, st_size, st_mtime_ns) anlık görüntüsüdür (bilinmiyorsa None), "group" grup indeksidir.
+        """
+        selected_files = []
+        for group_index, (group, checks) in enumerate(zip(self.groups, self._checks)):
+            stats = group.get("stats")
+            for file_index, checked in enumerate(checks):
+                if checked:
+                    selected_files.append({
+                        "path": group["files"][file_index],
+                        "size_bytes": group["size_bytes"],
+                        "stat": stats[file_index] if stats else None,
+                        "group": group_index
+                    })
+        return selected_files
+
+    def unchecked_files(self, group_index):
+        """Grupta korunacak (işaretsiz) dosyaları [(yol, stat anlık görüntüsü)] olarak döndürür."""
+        group = self.groups[group_index]
+        stats = group.get("stats")
+        return [(group["files"][file_index], stats[file_index] if stats else None)
+                for file_index, checked in enumerate(self._checks[group_index]) if not checked]
+
+    def remove_paths(self, removed_paths):
+        """Verilen yolları gruplardan çıkarır; boşalan gruplar silinir ve satır numaraları yeniden hesaplanır."""
+        removed_set = set(removed_paths)
+        if not removed_set:
+            return
+        kept_groups = []
+        for group, checks in zip(self.groups, self._checks):
+            kept_indexes = [index for index, file_path in enumerate(group["files"]) if file_path not in removed_set]
+            if len(kept_indexes) == len(checks):
+                kept_groups.append((group, checks))
+            elif kept_indexes:
+                group["files"] = [group["files"][index] for index in kept_indexes]
+                if group.get("stats"):
+                    group["stats"] = [group["stats"][index] for index in kept_indexes]
+                kept_groups.append((group, bytearray(checks[index] for index in kept_indexes)))
+        self._rebuild(kept_groups)
+
+    def update_group(self, group):
+        """Canlı izlemeden gelen grubun güncel halini uygular: aynı hash'li grup varsa dosyaları değiştirilir
+        (mevcut dosyaların sırası ve işaretleri korunur, yeni gelenler grubun sonuna işaretli eklenir), 2'den az
+        dosya kaldıysa grup kaldırılır, hiç yoksa sona eklenir.
+        Grup hash haritasıyla bulunur ve yalnızca etkilenen satırlar için satır ekleme/silme sinyalleri
+        gönderilir; model sıfırlanmadığı için incelenen seçim ve geçerli satır kaybolmaz.
+        """
+        group_index = self._group_index_by_hash.get(group["hash"])
+        if group_index is None:
+            if len(group["files"]) > 1:
+                self.append_groups([group])
+            return
+
+        start = self._group_starts[group_index]
+        if len(group["files"]) < 2:
+            file_count = len(self.groups[group_index]["files"])
+            self.beginRemoveRows(QModelIndex(), start, start + file_count - 1)
+            del self.groups[group_index]
+            del self._checks[group_index]
+            del self._group_starts[group_index]
+            self._shift_group_starts(group_index, -file_count)
+            del self._group_index_by_hash[group["hash"]]
+            for group_hash, index in self._group_index_by_hash.items():
+                if index > group_index:
+                    self._group_index_by_hash[group_hash] = index - 1
+            self.endRemoveRows()
+            if start < self._row_count: # Sonraki grupların sıra rengi değişti
+                self.dataChanged.emit(self.index(start, 0), self.index(self._row_count - 1, self.columnCount() - 1),
+                                      [Qt.BackgroundRole])
+            return
+
+        # Saklanan grup, satırları tek tek değiştirilebilsin diye kendi listeleriyle kopyalanır
+        new_files = list(group["files"])
+        stat_by_path = dict(zip(new_files, group["stats"])) if group.get("stats") else {}
+        files = list(self.groups[group_index]["files"])
+        checks = self._checks[group_index]
+        self.groups[group_index] = dict(group, files=files)
+
+        new_file_set = set(new_files)
+        for file_index in range(len(files) - 1, -1, -1): # Sondan başa: önceki satır numaraları değişmez
+            if files[file_index] not in new_file_set:
+                self.beginRemoveRows(QModelIndex(), start + file_index, start + file_index)
+                del files[file_index]
+                del checks[file_index]
+                self._shift_group_starts(group_index + 1, -1)
+                self.endRemoveRows()
+
+        old_file_set = set(files)
+        added_files = [file_path for file_path in new_files if file_path not in old_file_set]
+        if added_files:
+            first_row = start + len(files)
+            self.beginInsertRows(QModelIndex(), first_row, first_row + len(added_files) - 1)
+            files.extend(added_files)
+            checks.extend(b"\x01" * len(added_files))
+            self._shift_group_starts(group_index + 1, len(added_files))
+            self.endInsertRows()
+
+        if stat_by_path:
+            self.groups[group_index]["stats"] = [stat_by_path.get(file_path) for file_path in files]
+        if checks[0]:
+            checks[0] = 0 # Grubun ilk dosyası korunur
+            first_index = self.index(start, self.COL_CHECK)
+            self.dataChanged.emit(first_index, first_index, [Qt.CheckStateRole])
+
+    def _shift_group_starts(self, first_group, delta):
+        """first_group ve sonrasındaki grupların başlangıç satırlarını delta kadar kaydırır."""
+        self._group_starts[first_group:] = [row + delta for row in self._group_starts[first_group:]]
+        self._row_count += delta
+
+    def _rebuild(self, kept_groups):
+        """[(grup, işaretler)] listesinden grupları ve satır başlangıçlarını yeniden kurar."""
+        self.beginResetModel()
+        starts = []
+        row_count = 0
+        for group, checks in kept_groups:
+            starts.append(row_count)
+            row_count += len(group["files"])
+        self.groups[:] = [group for group, checks in kept_groups]
+        self._checks = [checks for group, checks in kept_groups]
+        self._group_starts, self._row_count = starts, row_count
+        self._group_index_by_hash = {group["hash"]: index for index, group in enumerate(self.groups)
+                                     if not group.get("linked", False)}
+        self.endResetModel()
+
 # ----------------------------------------------------------------------
-# 3. ANA PENCERE (DuplicateFinderApp)
+# 4. ANA PENCERE (DuplicateFinderApp)
 # ----------------------------------------------------------------------
 
 class DuplicateFinderApp(QMainWindow):
 
     GROUP_COLORS = [QColor("#3cb5ff"), QColor("#d7b981")]
+    LINKED_GROUP_COLOR = QColor("#b0b0b0") # Sabit bağ (hardlink) grupları: silmek yer kazandırmaz
 
     def __init__(self):
         global CURRENT_LANG
@@ -568,11 +959,15 @@ class DuplicateFinderApp(QMainWindow):
 
         self.icon_path = _find_icon_path()
         self.trash_manager = FakeTrashManager() 
-        self.duplicate_data = [] # Tarama sonuçlarını tutmak için
+        self._icon_provider = QFileIconProvider()
+        self._icon_cache = {} # Uzantı -> QIcon (tüm tablolar için ortak)
         
         # VİNŞ: Yeni başlangıç boyutu, ekran taşmasını engellemek için daha optimize edildi.
         self.setGeometry(100, 100, 900, 650) 
         self.worker_thread = None
+        self.session_options = {} # Son taramanın (veya açılan oturumun) seçenekleri ve hedef dizinleri
+        self.session_target_dirs = []
+        self.trash_thread = None # Çöp işlemleri (taşıma/geri yükleme/silme) için arka plan iş parçacığı
 
         if self.icon_path:
             self.setWindowIcon(QIcon(self.icon_path))
@@ -583,6 +978,7 @@ class DuplicateFinderApp(QMainWindow):
         self.setCentralWidget(self.central_widget)
         
         self._setup_ui()
+        self.duplicate_data = self.results_model.groups # Tarama sonuçlarını tutmak için (sonuç modeliyle ortak liste)
         self._setup_dir_management() # Dizin yönetimi sinyalleri
         self._connect_signals()      # Ana pencere sinyalleri
         
@@ -599,12 +995,18 @@ class DuplicateFinderApp(QMainWindow):
 
     # <<< YENİ METOT: DOSYA İKONUNU GETİRME >>>
     def _get_file_icon(self, file_path):
-        """Dosya yoluna göre sistemin varsayılan dosya ikonunu döndürür."""
-        # QFileInfo, dosya hakkındaki bilgileri almak için kullanılır.
-        file_info = QFileInfo(file_path)
-        # QFileIconProvider, QFileInfo'ya göre sistem ikonunu döndürür.
-        provider = QFileIconProvider()
-        return provider.icon(file_info)
+        """Dosya yoluna göre sistemin varsayılan dosya ikonunu döndürür.
+        İkonlar uzantıya göre önbelleklenir ve sonuç/çöp tabloları tarafından ortak kullanılır;
+        ikon temasına her uzantı için yalnızca bir kez gidilir.
+        """
+        extension = os.path.splitext(file_path)[1].lower()
+        icon = self._icon_cache.get(extension)
+        if icon is None:
+            # QFileInfo, dosya hakkındaki bilgileri almak için kullanılır.
+            # QFileIconProvider, QFileInfo'ya göre sistem ikonunu döndürür.
+            icon = self._icon_provider.icon(QFileInfo(file_path))
+            self._icon_cache[extension] = icon
+        return icon
     # <<< YENİ METOT SONU >>>
 # "Allah dünya üzerinde yarattığı bu kadar nimetleri bu kadar güzellikleri insanlar istifade etsin varlık içinde yaşasın diye yaratmıştır ve azamî derecede faydalanabilmek için de bütün yaratıklardan esirgediği zekâyı akıllı insanlara vermiştir." M. Kemal ATATÜRK
 
@@ -638,6 +1040,32 @@ class DuplicateFinderApp(QMainWindow):
             self.ignore_zero_byte.setText(get_text("ignore_zero_byte", lang))
             self.ignore_system_hidden.setText(get_text("ignore_system_hidden", lang))
             self.filter_group.setTitle(get_text("filter_group", lang))
+            self.performance_group.setTitle(get_text("performance_group", lang))
+            self.hash_workers_label.setText(get_text("hash_workers", lang))
+            self.scan_workers_label.setText(get_text("scan_workers", lang))
+            self.scan_workers_label.setToolTip(get_text("scan_workers_tooltip", lang))
+            self.hash_algorithm_label.setText(get_text("hash_algorithm", lang))
+            self.hash_algorithm_label.setToolTip(get_text("hash_algorithm_tooltip", lang))
+            fast_index = self.hash_algorithm_combo.findData("fast") # xxhash kurulu değilse seçenek yoktur
+            if fast_index >= 0:
+                self.hash_algorithm_combo.setItemText(fast_index, get_text("hash_algorithm_fast", lang).format(FAST_HASH_ALGORITHM))
+            self.verify_bytes.setText(get_text("verify_bytes", lang))
+            self.drop_page_cache.setText(get_text("drop_page_cache", lang))
+            self.drop_page_cache.setToolTip(get_text("drop_page_cache_tooltip", lang))
+            self.read_rate_label.setText(get_text("max_read_rate", lang))
+            self.read_rate_spin.setSpecialValueText(get_text("unlimited", lang))
+            self.file_rate_label.setText(get_text("max_file_rate", lang))
+            self.file_rate_spin.setSpecialValueText(get_text("unlimited", lang))
+            self.nice_label.setText(get_text("nice_level", lang))
+            self.nice_label.setToolTip(get_text("nice_level_tooltip", lang))
+            self.io_idle.setText(get_text("io_idle", lang))
+            self.io_idle.setToolTip(get_text("io_idle_tooltip", lang))
+            self.adaptive_throttle.setText(get_text("adaptive_throttle", lang))
+            self.adaptive_throttle.setToolTip(get_text("adaptive_throttle_tooltip", lang))
+            self.use_hash_cache.setText(get_text("use_hash_cache", lang))
+            self.use_dir_index.setText(get_text("use_dir_index", lang))
+            self.watch_mode.setText(get_text("watch_mode", lang))
+            self.watch_mode.setToolTip(get_text("watch_mode_tooltip", lang))
             self.filter_all.setText(get_text("filter_all", lang))
             self.filter_audio.setText(get_text("filter_audio", lang))
             self.filter_video.setText(get_text("filter_video", lang))
@@ -659,8 +1087,12 @@ class DuplicateFinderApp(QMainWindow):
 
             # Sonuçlar Tablosu
             self.found_label.setText(get_text("found_duplicates", lang))
-            self.results_table.setHorizontalHeaderLabels([get_text("col_delete", lang), get_text("col_filename", lang), get_text("col_path", lang), get_text("col_size", lang)])
+            self.results_model.set_headers([get_text("col_delete", lang), get_text("col_filename", lang), get_text("col_path", lang), get_text("col_size", lang)])
+            self.results_model.linked_tooltip = get_text("linked_group_tooltip", lang)
             self.delete_button.setText(get_text("delete_selected", lang))
+            self.export_button.setText(get_text("export_results", lang))
+            self.save_session_button.setText(get_text("save_session", lang))
+            self.open_session_button.setText(get_text("open_session", lang))
 
             # Fake Trash Tablosu
             self.trash_table.setHorizontalHeaderLabels(["", get_text("trash_col_file", lang), get_text("trash_col_original_path", lang), get_text("trash_col_deletion_date", lang)])
@@ -668,6 +1100,7 @@ class DuplicateFinderApp(QMainWindow):
             self.purge_button.setText(get_text("trash_purge", lang))
             self.select_all_trash_button.setText(get_text("select_all", lang))
             self.unselect_all_trash_button.setText(get_text("unselect_all", lang))
+            self.cancel_operation_button.setText(get_text("cancel_operation", lang))
 
 
             # Tarama Butonu ve Durum
@@ -862,6 +1295,78 @@ class DuplicateFinderApp(QMainWindow):
         filter_layout.addLayout(custom_ext_layout)
         settings_layout.addWidget(self.filter_group)
 
+        # PERFORMANS AYARLARI
+        self.performance_group = QGroupBox()
+        performance_layout = QVBoxLayout(self.performance_group)
+        hash_workers_layout = QHBoxLayout()
+        self.hash_workers_label = QLabel()
+        self.hash_workers_spin = QSpinBox()
+        self.hash_workers_spin.setRange(1, max(32, os.cpu_count() or 1))
+        self.hash_workers_spin.setValue(DEFAULT_HASH_WORKERS)
+        hash_workers_layout.addWidget(self.hash_workers_label)
+        hash_workers_layout.addWidget(self.hash_workers_spin)
+        performance_layout.addLayout(hash_workers_layout)
+        scan_workers_layout = QHBoxLayout()
+        self.scan_workers_label = QLabel()
+        self.scan_workers_spin = QSpinBox()
+        self.scan_workers_spin.setRange(1, 64)
+        self.scan_workers_spin.setValue(DEFAULT_SCAN_WORKERS)
+        scan_workers_layout.addWidget(self.scan_workers_label)
+        scan_workers_layout.addWidget(self.scan_workers_spin)
+        performance_layout.addLayout(scan_workers_layout)
+        hash_algorithm_layout = QHBoxLayout()
+        self.hash_algorithm_label = QLabel()
+        self.hash_algorithm_combo = QComboBox()
+        algorithm_names = {"md5": "MD5", "sha1": "SHA-1", "blake2b": "BLAKE2b-128"} # "fast" metni dil dosyasından gelir
+        for algorithm in HASH_ALGORITHM_CHOICES:
+            self.hash_algorithm_combo.addItem(algorithm_names.get(algorithm, algorithm), algorithm)
+        self.hash_algorithm_combo.setCurrentIndex(self.hash_algorithm_combo.findData(DEFAULT_HASH_ALGORITHM))
+        hash_algorithm_layout.addWidget(self.hash_algorithm_label)
+        hash_algorithm_layout.addWidget(self.hash_algorithm_combo)
+        performance_layout.addLayout(hash_algorithm_layout)
+        self.verify_bytes = QCheckBox()
+        performance_layout.addWidget(self.verify_bytes)
+        self.drop_page_cache = QCheckBox()
+        performance_layout.addWidget(self.drop_page_cache)
+        # Hız sınırları tarama sürerken de değiştirilebilir (_apply_rate_limits)
+        read_rate_layout = QHBoxLayout()
+        self.read_rate_label = QLabel()
+        self.read_rate_spin = QSpinBox()
+        self.read_rate_spin.setRange(0, 100000)
+        self.read_rate_spin.setSuffix(" MB/s")
+        self.read_rate_spin.valueChanged.connect(self._apply_rate_limits)
+        read_rate_layout.addWidget(self.read_rate_label)
+        read_rate_layout.addWidget(self.read_rate_spin)
+        performance_layout.addLayout(read_rate_layout)
+        file_rate_layout = QHBoxLayout()
+        self.file_rate_label = QLabel()
+        self.file_rate_spin = QSpinBox()
+        self.file_rate_spin.setRange(0, 100000)
+        self.file_rate_spin.valueChanged.connect(self._apply_rate_limits)
+        file_rate_layout.addWidget(self.file_rate_label)
+        file_rate_layout.addWidget(self.file_rate_spin)
+        performance_layout.addLayout(file_rate_layout)
+        nice_layout = QHBoxLayout()
+        self.nice_label = QLabel()
+        self.nice_spin = QSpinBox()
+        self.nice_spin.setRange(0, 19)
+        nice_layout.addWidget(self.nice_label)
+        nice_layout.addWidget(self.nice_spin)
+        performance_layout.addLayout(nice_layout)
+        self.io_idle = QCheckBox()
+        performance_layout.addWidget(self.io_idle)
+        self.adaptive_throttle = QCheckBox()
+        performance_layout.addWidget(self.adaptive_throttle)
+        self.use_hash_cache = QCheckBox()
+        self.use_hash_cache.setChecked(True)
+        performance_layout.addWidget(self.use_hash_cache)
+        self.use_dir_index = QCheckBox()
+        self.use_dir_index.setChecked(True)
+        performance_layout.addWidget(self.use_dir_index)
+        self.watch_mode = QCheckBox()
+        performance_layout.addWidget(self.watch_mode)
+        settings_layout.addWidget(self.performance_group)
+
         # BAŞLATMA BUTONLARI
         self.start_button = QPushButton()
         action_buttons_layout = QHBoxLayout()
@@ -888,8 +1393,9 @@ class DuplicateFinderApp(QMainWindow):
         scan_results_page = QWidget()
         results_layout = QVBoxLayout(scan_results_page)
         self.found_label = QLabel()
-        self.results_table = QTableWidget()
-        self.results_table.setColumnCount(4)
+        self.results_model = DuplicateResultsModel(self.GROUP_COLORS, self.LINKED_GROUP_COLOR, self._get_file_icon, self)
+        self.results_table = QTableView()
+        self.results_table.setModel(self.results_model)
         self.results_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeToContents)
         self.results_table.horizontalHeader().setSectionResizeMode(2, QHeaderView.Stretch)
         self.results_table.horizontalHeader().setSectionResizeMode(3, QHeaderView.ResizeToContents)
@@ -901,9 +1407,20 @@ class DuplicateFinderApp(QMainWindow):
         self.delete_button.setEnabled(False)
         self.delete_button.setStyleSheet("background-color: #f44336; color: white; font-weight: bold; height: 30px;")
 
+        self.export_button = QPushButton()
+        self.export_button.setStyleSheet("background-color: #2196F3; color: white; font-weight: bold; height: 30px;")
+
+        results_buttons_layout = QHBoxLayout()
+        results_buttons_layout.addWidget(self.delete_button)
+        results_buttons_layout.addWidget(self.export_button)
+        self.save_session_button = QPushButton()
+        self.open_session_button = QPushButton()
+        results_buttons_layout.addWidget(self.save_session_button)
+        results_buttons_layout.addWidget(self.open_session_button)
+
         results_layout.addWidget(self.found_label)
         results_layout.addWidget(self.results_table)
-        results_layout.addWidget(self.delete_button) 
+        results_layout.addLayout(results_buttons_layout)
 
         
         # 2. FAKE TRASH SEKME İÇERİĞİ
@@ -965,6 +1482,9 @@ class DuplicateFinderApp(QMainWindow):
         self.progress_bar.setRange(0, 100)
 
         progress_bar_layout.addWidget(self.progress_bar)
+        self.cancel_operation_button = QPushButton()
+        self.cancel_operation_button.setVisible(False) # Yalnızca çöp işlemleri sürerken görünür
+        progress_bar_layout.addWidget(self.cancel_operation_button)
 
         status_layout.addLayout(status_label_layout)
         status_layout.addLayout(progress_bar_layout)
@@ -986,9 +1506,12 @@ class DuplicateFinderApp(QMainWindow):
     def _connect_signals(self):
         self.start_button.clicked.connect(self._start_scan)
         self.delete_button.clicked.connect(self._delete_files_to_fake_trash) 
+        self.export_button.clicked.connect(self._export_results)
+        self.save_session_button.clicked.connect(self._save_session)
+        self.open_session_button.clicked.connect(self._open_session)
         self.language_button.clicked.connect(self._show_language_menu)
         self.about_button.clicked.connect(self._show_about)
-        self.results_table.cellDoubleClicked.connect(self._handle_double_click) 
+        self.results_table.doubleClicked.connect(self._handle_double_click) 
         self.filter_button_group.buttonClicked.connect(self._handle_filter_selection)
         self.custom_ext_input.setEnabled(False)
         
@@ -998,6 +1521,7 @@ class DuplicateFinderApp(QMainWindow):
         self.purge_button.clicked.connect(self._purge_selected_files)
         self.select_all_trash_button.clicked.connect(self._select_all_trash_files) 
         self.unselect_all_trash_button.clicked.connect(self._unselect_all_trash_files) 
+        self.cancel_operation_button.clicked.connect(self._cancel_trash_operation)
         
         # Trash tablosunda çift tıklama ile orijinal yolu açma
         self.trash_table.cellDoubleClicked.connect(self._handle_trash_double_click)
@@ -1016,19 +1540,17 @@ class DuplicateFinderApp(QMainWindow):
         else:
             self.custom_ext_input.setEnabled(False)
 
-    @Slot(int, int)
-    def _handle_double_click(self, row, column):
+    @Slot(QModelIndex)
+    def _handle_double_click(self, index):
         """Tarama Sonuçları tablosunda çift tıklama."""
         try:
+            column = index.column()
             if column == 1 or column == 2:
-                file_name_item = self.results_table.item(row, 1)
-                folder_path_item = self.results_table.item(row, 2)
-                
-                if not file_name_item or not folder_path_item: return
+                if not index.isValid(): return
 
-                file_name = file_name_item.text()
-                folder_path = folder_path_item.text()
-                full_path = os.path.join(folder_path, file_name)
+                full_path = self.results_model.file_path(index.row())
+                file_name = os.path.basename(full_path)
+                folder_path = os.path.dirname(full_path) + os.path.sep
 
                 if column == 1:
                     path_to_open = full_path
@@ -1110,11 +1632,13 @@ class DuplicateFinderApp(QMainWindow):
     def _start_scan(self):
         
         if self.worker_thread and self.worker_thread.isRunning():
+            was_watching = self.worker_thread.watching
             self.worker_thread.stop()
             self.worker_thread.wait()
             self.start_button.setText(get_text("start_scan"))
             self.start_button.setStyleSheet("background-color: #4CAF50; color: white; font-weight: bold; height: 35px;")
-            self.status_label.setText(f'{get_text("status_prefix")}: {get_text("status_canceled")}')
+            status_key = "status_watch_stopped" if was_watching else "status_canceled"
+            self.status_label.setText(f'{get_text("status_prefix")}: {get_text(status_key)}')
             return
 
         match_options = {
@@ -1142,7 +1666,23 @@ class DuplicateFinderApp(QMainWindow):
             "custom_extensions": self.custom_ext_input.text()
         }
 
-        options = {"match": match_options, "ignore": ignore_options, "filter": filter_options}
+        performance_options = {
+            "hash_workers": self.hash_workers_spin.value(),
+            "scan_workers": self.scan_workers_spin.value(),
+            "use_hash_cache": self.use_hash_cache.isChecked(),
+            "use_dir_index": self.use_dir_index.isChecked(),
+            "hash_algorithm": self.hash_algorithm_combo.currentData(),
+            "verify_bytes": self.verify_bytes.isChecked(),
+            "drop_page_cache": self.drop_page_cache.isChecked(),
+            "max_read_mb_per_second": self.read_rate_spin.value(),
+            "max_files_per_second": self.file_rate_spin.value(),
+            "nice_level": self.nice_spin.value(),
+            "io_idle": self.io_idle.isChecked(),
+            "adaptive_throttle": self.adaptive_throttle.isChecked(),
+        }
+
+        options = {"match": match_options, "ignore": ignore_options, "filter": filter_options, "performance": performance_options,
+                   "watch": self.watch_mode.isChecked()}
 
         target_dirs = [self.dir_list.item(i).text() for i in range(self.dir_list.count())]
 
@@ -1150,7 +1690,9 @@ class DuplicateFinderApp(QMainWindow):
             self.status_label.setText(f'{get_text("status_prefix")}: {get_text("status_error_dir")}')
             return
 
-        self.results_table.setRowCount(0)
+        self.results_model.clear()
+        self.session_options = options
+        self.session_target_dirs = target_dirs
         self.progress_bar.setValue(0)
         self.delete_button.setEnabled(False)
         self.start_button.setText(get_text("cancel_scan"))
@@ -1159,10 +1701,18 @@ class DuplicateFinderApp(QMainWindow):
         self.worker_thread = WorkerThread(target_dirs, options)
         self.worker_thread.progress_updated.connect(self._update_progress)
         self.worker_thread.status_message.connect(self._update_status)
+        self.worker_thread.group_found.connect(self._append_result_group)
+        self.worker_thread.group_updated.connect(self._update_result_group)
         self.worker_thread.scan_finished.connect(self._display_results)
         self.worker_thread.finished.connect(self._scan_finished_cleanup)
         self.worker_thread.start()
 
+    @Slot()
+    def _apply_rate_limits(self):
+        """Hız sınırı kutuları değişince çalışan taramaya anında uygular."""
+        if self.worker_thread and self.worker_thread.isRunning():
+            self.worker_thread.engine.set_rate_limits(self.read_rate_spin.value(), self.file_rate_spin.value())
+
     @Slot(int)
     def _update_progress(self, value):
         self.progress_bar.setValue(value)
@@ -1174,95 +1724,138 @@ class DuplicateFinderApp(QMainWindow):
 
     @Slot()
     def _scan_finished_cleanup(self):
+        self.start_button.setEnabled(not self._trash_operation_running()) # Çöp işlemi bitince _set_trash_buttons_enabled açar
         self.start_button.setText(get_text("rescan"))
         self.start_button.setStyleSheet("background-color: #4CAF50; color: white; font-weight: bold; height: 35px;")
 
-    @Slot(list)
-    def _display_results(self, duplicate_groups):
-        
-        self.results_table.setRowCount(0)
-        row_count = 0
-
-        # Sonuçları, hash, boyut ve dosyalarla birlikte saklamak için yeni bir yapı
-        self.duplicate_data = duplicate_groups 
+    @Slot(dict)
+    def _append_result_group(self, group):
+        """Tarama sürerken bulunan tek bir kopya grubunu tabloya ekler."""
+        self._append_groups([group])
 
-        for group_index, group in enumerate(duplicate_groups):
-            group_color = self.GROUP_COLORS[group_index % len(self.GROUP_COLORS)]
+    @Slot(dict)
+    def _update_result_group(self, group):
+        """Canlı izlemede üyeleri değişen grubu tabloda günceller."""
+        self.results_model.update_group(group)
+        self.delete_button.setEnabled(self.results_model.rowCount() > 0 and not self._trash_operation_running())
 
-            for file_index, file_path in enumerate(group["files"]):
-                self.results_table.insertRow(row_count)
+    @Slot(list)
+    def _display_results(self, duplicate_groups):
+        """Tarama bittiğinde kalan grupları (sabit bağ grupları) ekler ve silme işlemini açar."""
+        self._append_groups(duplicate_groups)
+        self.delete_button.setEnabled(self.results_model.rowCount() > 0 and not self._trash_operation_running())
+        self.tab_widget.setCurrentIndex(0) 
+        if self.worker_thread and self.worker_thread.options.get("watch", False):
+            # İş parçacığı izlemeye devam eder; düğme izlemeyi durdurur
+            self.start_button.setText(get_text("stop_watching"))
 
-                file_name = os.path.basename(file_path)
-                folder_path = os.path.dirname(file_path) + os.path.sep
+    def _append_groups(self, duplicate_groups):
+        """Grupları sonuç modelinin sonuna ekler; renk sırası önceki gruplardan devam eder."""
+        self.results_model.append_groups(duplicate_groups)
 
-                check_item = QTableWidgetItem()
-                check_item.setFlags(Qt.ItemIsUserCheckable | Qt.ItemIsEnabled)
+    def _remove_deleted_rows(self, deleted_files_paths):
+        
+        self.results_model.remove_paths(deleted_files_paths)
 
-                if file_index == 0:
-                    check_item.setCheckState(Qt.CheckState.Unchecked)
-                else:
-                    check_item.setCheckState(Qt.CheckState.Checked)
+        if self.results_model.rowCount() == 0:
+            self.delete_button.setEnabled(False)
+            
+    @Slot()
+    def _export_results(self):
+        """Sonuç gruplarını JSON-lines veya CSV dosyasına yazar (gruplar tek tek yazılır, kopya liste kurulmaz)."""
+        if self.results_model.rowCount() == 0:
+            self.status_label.setText(f'{get_text("status_prefix")}: {get_text("status_export_empty")}')
+            return
 
-                self.results_table.setItem(row_count, 0, check_item)
+        file_path, selected_filter = QFileDialog.getSaveFileName(
+            self, get_text("export_results"), os.path.join(os.path.expanduser('~'), 'duplicates.jsonl'),
+            "JSON Lines (*.jsonl);;CSV (*.csv)"
+        )
+        if not file_path:
+            return
+        export_format = "csv" if selected_filter.startswith("CSV") or file_path.lower().endswith(".csv") else "jsonl"
+        if not os.path.splitext(file_path)[1]:
+            file_path += "." + export_format
 
-                name_item = QTableWidgetItem(file_name)
-                # <<< YENİ: İKON EKLEME >>>
-                file_icon = self._get_file_icon(file_path)
-                name_item.setIcon(file_icon) 
-                # <<< YENİ: İKON EKLEME SONU >>>
+        try:
+            with GroupExporter(file_path, export_format) as exporter:
+                for group in self.results_model.groups:
+                    exporter.write_group(group)
+        except OSError as e:
+            print(f"HATA: Sonuçlar dışa aktarılamadı: {e}")
+            self.status_label.setText(f'{get_text("status_prefix")}: {get_text("status_export_failed").format(file_path)}')
+            return
 
-                path_item = QTableWidgetItem(folder_path)
-                size_item = QTableWidgetItem(group["size"]) # Okunabilir boyut
+        self.status_label.setText(f'{get_text("status_prefix")}: {get_text("status_exported").format(exporter.group_count, file_path)}')
 
-                # QTableWidgetItem'e boyut (bytes) ve hash verisini saklamak için özel veri set ediyoruz
-                path_item.setData(Qt.UserRole, group["size_bytes"]) 
-                path_item.setData(Qt.UserRole + 1, group["hash"])
+    # <<< KAYITLI TARAMA OTURUMLARI >>>
+    def _session_dir(self):
+        session_dir = os.path.join(os.path.expanduser('~'), '.duplicateagent', 'sessions')
+        os.makedirs(session_dir, exist_ok=True)
+        return session_dir
 
-                for col in range(self.results_table.columnCount()):
-                    item = self.results_table.item(row_count, col)
-                    if not item:
-                         item = QTableWidgetItem()
-                         self.results_table.setItem(row_count, col, item)
-                    item.setBackground(QBrush(group_color))
+    @Slot()
+    def _save_session(self):
+        """Sonuçları, tarama seçeneklerini ve stat anlık görüntüsünü bir oturum dosyasına kaydeder."""
+        if self.results_model.rowCount() == 0:
+            self.status_label.setText(f'{get_text("status_prefix")}: {get_text("status_export_empty")}')
+            return
 
-                self.results_table.setItem(row_count, 1, name_item)
-                self.results_table.setItem(row_count, 2, path_item)
-                self.results_table.setItem(row_count, 3, size_item)
+        default_name = datetime.now().strftime('scan-%Y%m%d-%H%M.dasession')
+        file_path, _ = QFileDialog.getSaveFileName(
+            self, get_text("save_session"), os.path.join(self._session_dir(), default_name),
+            "Duplicate Agent Session (*.dasession)"
+        )
+        if not file_path:
+            return
+        if not file_path.endswith('.dasession'):
+            file_path += '.dasession'
 
-                row_count += 1
+        try:
+            group_count = ScanSession.save(file_path, self.results_model.groups, self.session_target_dirs, self.session_options)
+        except OSError as e:
+            print(f"HATA: Oturum kaydedilemedi: {e}")
+            self.status_label.setText(f'{get_text("status_prefix")}: {get_text("status_export_failed").format(file_path)}')
+            return
+        self.status_label.setText(f'{get_text("status_prefix")}: {get_text("status_session_saved").format(group_count, file_path)}')
 
-        self.results_table.setRowCount(row_count)
-        self.delete_button.setEnabled(row_count > 0)
-        self.tab_widget.setCurrentIndex(0) 
+    @Slot()
+    def _open_session(self):
+        """Kaydedilmiş oturumu yeniden tarama yapmadan açar; dosya yolları tabloda göründükçe okunur."""
+        if self.worker_thread and self.worker_thread.isRunning():
+            return
+        file_path, _ = QFileDialog.getOpenFileName(
+            self, get_text("open_session"), self._session_dir(), "Duplicate Agent Session (*.dasession)"
+        )
+        if not file_path:
+            return
 
-    def _remove_deleted_rows(self, deleted_files_paths):
-        
-        deleted_set = set(deleted_files_paths)
-        for row in range(self.results_table.rowCount() - 1, -1, -1):
-            folder_path = self.results_table.item(row, 2).text()
-            file_name = self.results_table.item(row, 1).text()
-            full_path = os.path.join(folder_path, file_name)
+        # Gruplar arayüz temizlenmeden önce kurulur; bozuk dosya mevcut sonuçları silmesin
+        try:
+            session = ScanSession(file_path)
+            session_groups = session.groups()
+        except (OSError, ValueError) as e:
+            print(f"HATA: Oturum açılamadı: {e}")
+            self.status_label.setText(f'{get_text("status_prefix")}: {get_text("status_session_invalid").format(file_path)}')
+            return
 
-            if full_path in deleted_set:
-                self.results_table.removeRow(row)
+        self.results_model.clear()
+        self.session_options = session.options
+        self.session_target_dirs = session.target_dirs
+        self.dir_list.clear()
+        self.dir_list.addItems(session.target_dirs)
+        self._append_groups(session_groups)
+        self.delete_button.setEnabled(self.results_model.rowCount() > 0 and not self._trash_operation_running())
+        self.tab_widget.setCurrentIndex(0)
+        self.status_label.setText(f'{get_text("status_prefix")}: {get_text("status_session_loaded").format(session.group_count, session.saved_at)}')
 
-        if self.results_table.rowCount() == 0:
-            self.delete_button.setEnabled(False)
-            
     # <<< FAKE TRASH KULLANIMI >>>
     @Slot()
     def _delete_files_to_fake_trash(self):
         """Seçilen dosyaları Sahte Çöp Kutusu'na taşır."""
-        selected_files = []
-        for row in range(self.results_table.rowCount()):
-            item = self.results_table.item(row, 0)
-            if item and item.checkState() == Qt.CheckState.Checked:
-                folder_path = self.results_table.item(row, 2).text()
-                file_name = self.results_table.item(row, 1).text()
-                # size_bytes'ı UserRole'dan al
-                size_bytes = self.results_table.item(row, 2).data(Qt.UserRole)
-                full_path = os.path.join(folder_path, file_name)
-                selected_files.append({"path": full_path, "size_bytes": size_bytes})
+        if self._trash_operation_running():
+            return # Önceki çöp işlemi bitmeden yenisi başlatılmaz
+        selected_files = self.results_model.checked_files()
 
         if not selected_files:
             self.status_label.setText(f'{get_text("status_prefix")}: {get_text("trash_error_select")}')
@@ -1280,28 +1873,103 @@ class DuplicateFinderApp(QMainWindow):
             self.status_label.setText(f'{get_text("status_prefix")}: {get_text("trash_canceled")}')
             return
 
-        moved_count = 0
-        error_count = 0
-        moved_paths = []
+        # Taramadan (veya oturum kaydından) sonra değişen dosyalar artık kopya olmayabilir; silinmez.
+        # Doğrulama (stat) arka plan iş parçacığında, her dosya taşınmadan hemen önce yapılır; burada yalnızca
+        # grubun korunan kopyaları öğeye eklenir (grup başına tek liste).
+        kept_by_group = {}
+        for item in selected_files:
+            if item["group"] not in kept_by_group:
+                kept_by_group[item["group"]] = self.results_model.unchecked_files(item["group"])
+            item["kept"] = kept_by_group[item["group"]]
 
         self.status_label.setText(f'{get_text("status_prefix")}: {get_text("delete_selected")}')
+        self._start_trash_operation("move", selected_files)
 
-        for file_data in selected_files:
-            if self.trash_manager.move_to_trash(file_data["path"], file_data["size_bytes"]):
-                moved_count += 1
-                moved_paths.append(file_data["path"])
-            else:
-                error_count += 1
+    # <<< ÇÖP İŞLEMLERİNİN ARKA PLANDA YÜRÜTÜLMESİ >>>
+    def _start_trash_operation(self, operation, items):
+        """Çöp işlemini TrashOperationThread'de başlatır; işlem süresince ilgili butonlar kapanır."""
+        self._set_trash_buttons_enabled(False)
+        self.progress_bar.setValue(0)
+        self.cancel_operation_button.setVisible(True)
+
+        self.trash_thread = TrashOperationThread(self.trash_manager, operation, items)
+        self._trash_operation_total = len(items)
+        self.trash_thread.progress_updated.connect(self._update_progress)
+        self.trash_thread.status_message.connect(self._update_status)
+        self.trash_thread.operation_finished.connect(self._trash_operation_finished)
+        self.trash_thread.start()
+
+    def _trash_operation_running(self):
+        return self.trash_thread is not None and self.trash_thread.isRunning()
+
+    def _set_trash_buttons_enabled(self, enabled, trash_tab_only=False):
+        """Çöp işlemine bağlı butonları açar/kapatır; bir çöp işlemi sürerken hiçbiri açılmaz.
+        Tarama sürerken başlat düğmesi İptal/İzlemeyi Durdur düğmesidir ve hep açık kalır; silme ise tarama
+        bitene (ya da izleme kipine geçene) kadar açılmaz, yarım sonuç üzerinde çalışılmasın.
+        """
+        enabled = enabled and not self._trash_operation_running()
+        if not trash_tab_only:
+            scan_running = self.worker_thread is not None and self.worker_thread.isRunning()
+            if not scan_running:
+                self.start_button.setEnabled(enabled)
+            results_complete = not scan_running or self.worker_thread.watching
+            self.delete_button.setEnabled(enabled and results_complete and self.results_model.rowCount() > 0)
+        self.restore_button.setEnabled(enabled and self.trash_table.rowCount() > 0)
+        self.purge_button.setEnabled(enabled and self.trash_table.rowCount() > 0)
 
-        self._remove_deleted_rows(moved_paths)
-        self.update_trash_tab() 
+    @Slot()
+    def _cancel_trash_operation(self):
+        if self.trash_thread and self.trash_thread.isRunning():
+            self.trash_thread.stop()
+
+    @Slot(str, list)
+    def _trash_operation_finished(self, operation, results):
+        """İşlem raporunu gösterir: başarı/hata sayıları, iptal durumu ve başarısız dosyaların listesi."""
+        self.trash_thread.wait()
+        self.cancel_operation_button.setVisible(False)
+
+        done_paths = [file_path for file_path, ok in results if ok]
+        failed_paths = [file_path for file_path, ok in results if not ok]
+        done_count = len(done_paths)
+        error_count = len(failed_paths)
+
+        if operation == "move":
+            self._remove_deleted_rows(done_paths)
+            title = get_text("delete_confirm_title")
+            success_key, error_key = "trash_success", "trash_error"
+        elif operation == "restore":
+            title = get_text("restore_confirm_title")
+            success_key, error_key = "restore_success", "restore_error"
+        else:
+            title = get_text("purge_confirm_title")
+            success_key, error_key = "purge_success", "purge_error"
+
+        self.update_trash_tab()
+        self._set_trash_buttons_enabled(True)
 
         if error_count == 0:
-            final_message = get_text("trash_success").format(moved_count)
-            QMessageBox.information(self, get_text("delete_confirm_title"), final_message)
+            final_message = get_text(success_key).format(done_count)
         else:
-            final_message = get_text("trash_error").format(moved_count, error_count)
-            QMessageBox.warning(self, get_text("delete_confirm_title"), final_message)
+            final_message = get_text(error_key).format(done_count, error_count)
+
+        if operation == "move" and self.trash_thread.changed_paths:
+            final_message += "\n" + get_text("files_changed_since_scan").format(len(self.trash_thread.changed_paths))
+
+        skipped_count = self._trash_operation_total - len(results)
+        if skipped_count > 0:
+            final_message += "\n" + get_text("operation_canceled_partial").format(len(results), self._trash_operation_total)
+
+        report_dialog = QMessageBox(self)
+        report_dialog.setWindowTitle(title)
+        report_dialog.setText(final_message)
+        if error_count == 0 and skipped_count == 0:
+            report_dialog.setIcon(QMessageBox.Information)
+        else:
+            report_dialog.setIcon(QMessageBox.Warning)
+        if failed_paths:
+            # Dosya bazlı rapor: hangi dosyaların işlenemediği "Ayrıntılar" bölümünde listelenir
+            report_dialog.setDetailedText("\n".join(failed_paths))
+        report_dialog.exec()
 
         self.status_label.setText(f'{get_text("status_prefix")}: {final_message}')
         
@@ -1327,17 +1995,15 @@ class DuplicateFinderApp(QMainWindow):
         for mount_point in known_mount_points:
             # Disk bazlı çöp dizin yolu
             trash_dir = os.path.join(mount_point, '.Trash-DuplicateAgent')
-            metadata_path = os.path.join(trash_dir, 'trashdata.json')
 
-            if os.path.exists(metadata_path):
-                # FakeTrashManager'ın yeni _load_metadata metodunu kullan
-                disk_trash_data = self.trash_manager._load_metadata(metadata_path)
-                
-                # Her öğeye trash_dir bilgisini ekleyelim (Güvenlik katmanı)
-                for item in disk_trash_data:
-                    if "trash_dir" not in item:
-                         item["trash_dir"] = trash_dir
-                    all_trash_data.append(item)
+            # FakeTrashManager günlüğü okur (eski trashdata.json varsa dönüştürür)
+            disk_trash_data = self.trash_manager.get_disk_entries(trash_dir)
+
+            # Her öğeye trash_dir bilgisini ekleyelim (Güvenlik katmanı)
+            for item in disk_trash_data:
+                if "trash_dir" not in item:
+                     item["trash_dir"] = trash_dir
+                all_trash_data.append(item)
 
         trash_data = all_trash_data
         self.trash_table.setRowCount(0)
@@ -1381,9 +2047,7 @@ class DuplicateFinderApp(QMainWindow):
             row_count += 1
             
         self.trash_table.setRowCount(row_count)
-        is_any_file = row_count > 0
-        self.restore_button.setEnabled(is_any_file)
-        self.purge_button.setEnabled(is_any_file)
+        self._set_trash_buttons_enabled(True, trash_tab_only=True)
         
     @Slot()
     def _select_all_trash_files(self):
@@ -1429,6 +2093,8 @@ class DuplicateFinderApp(QMainWindow):
     @Slot()
     def _restore_selected_files(self):
         """Seçili dosyaları orijinal konumuna geri yükler."""
+        if self._trash_operation_running():
+            return
         selected_files = self._get_selected_trash_items()
         if not selected_files:
             QMessageBox.warning(self, get_text("restore_confirm_title"), get_text("restore_error_select"))
@@ -1444,32 +2110,15 @@ class DuplicateFinderApp(QMainWindow):
 
         if reply == QMessageBox.StandardButton.No: return
 
-        restored_count = 0
-        error_count = 0
-
         self.status_label.setText(f'{get_text("status_prefix")}: {get_text("status_restoring_files")}')
-        for file_data in selected_files:
-            # trash_dir parametresini ekle
-            if self.trash_manager.restore_file(file_data["trash_filename"], file_data["original_path"], file_data["trash_dir"]):
-                restored_count += 1
-            else:
-                error_count += 1
-
-        self.update_trash_tab()
-        
-        if error_count == 0:
-            final_message = get_text("restore_success").format(restored_count)
-            QMessageBox.information(self, get_text("restore_confirm_title"), final_message)
-        else:
-            final_message = get_text("restore_error").format(restored_count, error_count)
-            QMessageBox.warning(self, get_text("restore_confirm_title"), final_message)
-
-        self.status_label.setText(f'{get_text("status_prefix")}: {final_message}')
+        self._start_trash_operation("restore", selected_files)
 
 
     @Slot()
     def _purge_selected_files(self):
         """Seçili dosyaları diskten kalıcı olarak siler."""
+        if self._trash_operation_running():
+            return
         selected_files = self._get_selected_trash_items()
         if not selected_files:
             QMessageBox.warning(self, get_text("purge_confirm_title"), get_text("purge_error_select"))
@@ -1485,27 +2134,8 @@ class DuplicateFinderApp(QMainWindow):
 
         if reply == QMessageBox.StandardButton.No: return
 
-        purged_count = 0
-        error_count = 0
-
         self.status_label.setText(f'{get_text("status_prefix")}: {get_text("status_purging_files")}')
-        for file_data in selected_files:
-            # trash_dir parametresini ekle
-            if self.trash_manager.purge_file(file_data["trash_filename"], file_data["original_path"], file_data["trash_dir"]):
-                purged_count += 1
-            else:
-                error_count += 1
-
-        self.update_trash_tab()
-
-        if error_count == 0:
-            final_message = get_text("purge_success").format(purged_count)
-            QMessageBox.information(self, get_text("purge_confirm_title"), final_message)
-        else:
-            final_message = get_text("purge_error").format(purged_count, error_count)
-            QMessageBox.warning(self, get_text("purge_confirm_title"), final_message)
-
-        self.status_label.setText(f'{get_text("status_prefix")}: {final_message}')
+        self._start_trash_operation("purge", selected_files)
 
 # "Geldikleri gibi giderler..." M. Kemal ATATÜRK (Geldikleri gibi gittiler). 
 
@@ -1539,7 +2169,7 @@ class DuplicateFinderApp(QMainWindow):
 #Feed your head
 # ---Jafferson Airplane---
 
-# 4. UYGULAMA BAŞLANGICI
+# 5. UYGULAMA BAŞLANGICI
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
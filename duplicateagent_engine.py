@@ -0,0 +1,1987 @@
+#!/usr/bin/env python3
+"""Duplicate Agent tarama çekirdeği.
+
+Qt içe aktarmaz; GUI (duplicateagent.0.9.3.py) bu modülü kullanır, ekransız sunucularda ise
+doğrudan komut satırından çalıştırılabilir:
+
+    python3 duplicateagent_engine.py /srv/paylasim --format jsonl --output sonuc.jsonl
+"""
+
+import sys
+import os
+import hashlib
+import errno
+import stat
+import json
+import gc
+import mmap
+import tempfile
+import shutil
+import argparse
+import configparser
+import csv
+import signal
+import sqlite3
+import time
+import select
+import ctypes
+import struct
+import threading
+from array import array
+from collections import deque, Counter
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+try:
+    import xxhash # İsteğe bağlı: hızlı kip için xxh3_128
+except ImportError:
+    xxhash = None
+
+# FİLTRE SABİTLERİ Burası sayesinde kullanıcıya uzantı seçtirebiliyoruz. Şimdilik burası sorunsuz çalışıyor görünüyor. Olmazsa Fatihe bir sorayım. 
+EXTENSION_FILTERS = {
+    "all": [],
+    "audio": [".mp3", ".wav", ".flac", ".ogg", ".m4a", ".aac"],
+    "video": [".mp4", ".mkv", ".avi", ".mov", ".wmv", ".flv", ".webm", ".m4v"],
+    "image": [".jpg", ".jpeg", ".png", ".gif", ".bmp", ".tiff", ".webp", ".svg", ".ico", ".raw"],
+    "text": [".txt", ".log", ".md", ".json", ".xml", ".ini", ".conf", ".cfg", ".sh", ".py", ".html", ".css", ".js"],
+    "office": [".doc", ".docx", ".odt", ".xls", ".xlsx", ".ods", ".ppt", ".pptx", ".odp", ".rtf"],
+    "pdf": [".pdf"],
+    "archive": [".zip", ".rar", ".7z", ".tar", ".gz", ".bz2", ".xz", ".tgz"],
+    "custom": []
+}
+
+# ----------------------------------------------------------------------
+# HASH VE TARAMA MANTIĞI
+# ----------------------------------------------------------------------
+
+# Hash hesaplayan iş parçacığı sayısı. hashlib büyük bloklarda GIL'i bıraktığı için gerçekten paralel çalışırlar.
+DEFAULT_HASH_WORKERS = min(4, os.cpu_count() or 1)
+
+# Ön eleme aşamalarında dosyanın başından ve sonundan okunan blok boyutu
+PARTIAL_HASH_BLOCK = 4096
+
+# Algoritma adı -> hasher fabrikası (isteğe bağlı ilk veriyle çağrılır; update() ve digest() sunar).
+# Ad, sonuç gruplarına ("algorithm"), hash önbelleğine ve oturum dosyalarına yazılır.
+HASH_ALGORITHMS = {
+    "md5": hashlib.md5,
+    "sha1": hashlib.sha1,
+    "blake2b": lambda data=b'': hashlib.blake2b(data, digest_size=16), # 128 bit yeter, MD5 ile aynı boyut
+}
+if xxhash is not None:
+    HASH_ALGORITHMS["xxh3_128"] = xxhash.xxh3_128
+
+# Kullanıcıya sunulan seçimler; "fast" (xxh3_128) yalnızca xxhash kuruluysa sunulur. zlib sağlama toplamları gibi
+# zayıf bir yedek, her grubun bayt bayt doğrulanmasını gerektirir ve kopyaları iki kez okutur; SHA-1'den yavaş kalır.
+FAST_HASH_ALGORITHM = "xxh3_128" if xxhash is not None else None
+HASH_ALGORITHM_CHOICES = ("fast", "md5", "sha1", "blake2b") if xxhash is not None else ("md5", "sha1", "blake2b")
+# xxh3_128 varsa o, yoksa SHA-1 (SHA uzantılı işlemcilerde MD5'in yaklaşık iki katı hızlı)
+DEFAULT_HASH_ALGORITHM = "fast" if xxhash is not None else "sha1"
+
+def resolve_hash_algorithm(name):
+    """Seçimi (ör. "fast") HASH_ALGORITHMS'teki somut algoritma adına çevirir; bilinmeyen ad ValueError verir.
+    xxhash kurulu olmayan makinede "fast" (ör. başka makinede kaydedilmiş seçeneklerden) varsayılana düşer.
+    """
+    if name == "fast":
+        return FAST_HASH_ALGORITHM or resolve_hash_algorithm(DEFAULT_HASH_ALGORITHM)
+    if name not in HASH_ALGORITHMS:
+        raise ValueError(f"Bilinmeyen hash algoritması: {name}")
+    return name
+
+# Tam hash okumalarının parça boyutu. Büyük parça, dosya başına sistem çağrısı ve Python döngüsü sayısını
+# binlerce kat azaltır; dönen disklerde daha da büyütülür ki tek okuyucu uzun sıralı okumalar yapsın.
+HASH_READ_CHUNK = 1024 * 1024
+HASH_READ_CHUNK_ROTATIONAL = 4 * 1024 * 1024
+
+_read_buffers = threading.local() # İş parçacığı başına tek, yeniden kullanılan okuma tamponu
+
+def _read_buffer(size):
+    """Çağıran iş parçacığının en az size baytlık tamponunun size baytlık memoryview'unu döndürür."""
+    buffer = getattr(_read_buffers, "buffer", None)
+    if buffer is None or len(buffer) < size:
+        buffer = memoryview(bytearray(size))
+        _read_buffers.buffer = buffer
+    return buffer[:size]
+
+def advise_file(fd, advice, offset=0, length=0):
+    """os.posix_fadvise'ı advice adıyla (ör. "POSIX_FADV_SEQUENTIAL") çağırır; length=0 dosyanın sonuna kadar demektir.
+    Platform veya dosya sistemi desteklemiyorsa sessizce geçer; ipuçları yalnızca performansı etkiler.
+    """
+    advice_value = getattr(os, advice, None)
+    if advice_value is None:
+        return
+    try:
+        os.posix_fadvise(fd, offset, length, advice_value)
+    except OSError:
+        pass
+
+def calculate_block_digest(filepath, algorithm="md5", from_end=False, block_size=PARTIAL_HASH_BLOCK, drop_cache=False,
+                           limiter=None):
+    """Dosyanın yalnızca ilk (from_end=True ise son) bloğunun ham özetini (bytes) hesaplar.
+    Blok boyutundan küçük dosyalarda sonuç, aynı algoritmayla tam dosya özetiyle aynıdır.
+    drop_cache: önden okuma kapatılır ve yalnızca okunan bloğun sayfaları hemen önbellekten çıkarılır; dosyanın
+    başka biri için önbellekte duran kalan sayfalarına dokunulmaz (bkz. calculate_digest).
+    limiter: verilirse (RateLimiter) açılan dosya ve okunan baytlar ona bildirilir.
+    """
+    try:
+        if limiter:
+            limiter.consume_file()
+        with open(filepath, 'rb', buffering=0) as file:
+            if drop_cache:
+                advise_file(file.fileno(), "POSIX_FADV_RANDOM") # Tek blok için 128 KB önden okuma yapılmasın
+            if from_end:
+                file.seek(0, os.SEEK_END)
+                file.seek(max(0, file.tell() - block_size))
+            offset = file.tell()
+            data = file.read(block_size)
+            digest = HASH_ALGORITHMS[algorithm](data).digest()
+            if limiter:
+                limiter.consume_bytes(len(data))
+            if drop_cache:
+                advise_file(file.fileno(), "POSIX_FADV_DONTNEED", offset, len(data))
+            return digest
+    except (IOError, OSError):
+        return None
+
+def calculate_digest(filepath, algorithm="md5", chunk_size=HASH_READ_CHUNK, drop_cache=False, limiter=None):
+    """Büyük dosyalar için belleği yormadan dosyanın ham özetini (bytes) hesaplar.
+    Okumalar iş parçacığına ait önceden ayrılmış tampona readinto ile yapılır ve hasher'a memoryview dilimi
+    verilir; parça başına yeni bytes nesnesi oluşmaz, kopyalama yapılmaz.
+    drop_cache: hash'lenen her parçanın sayfaları POSIX_FADV_DONTNEED ile hemen sayfa önbelleğinden atılır;
+    tarama önbellekte yalnızca önden okuma penceresi kadar yer kaplar, sunucudaki diğer uygulamaların
+    önbelleği itilmez.
+    limiter: verilirse (RateLimiter) dosya açılışı ve her parça ona bildirilir; sınır aşılırsa okuma bekler.
+    """
+    hasher = HASH_ALGORITHMS[algorithm]()
+    buffer = _read_buffer(chunk_size)
+    try:
+        if limiter:
+            limiter.consume_file()
+        with open(filepath, 'rb', buffering=0) as file:
+            fd = file.fileno()
+            advise_file(fd, "POSIX_FADV_SEQUENTIAL")
+            if drop_cache:
+                advise_file(fd, "POSIX_FADV_NOREUSE") # Linux 6.3+ bu sayfaları ilk boşaltılacaklar arasına koyar
+            offset = 0
+            while True:
+                read_size = file.readinto(buffer)
+                if not read_size:
+                    break
+                hasher.update(buffer[:read_size])
+                if limiter:
+                    limiter.consume_bytes(read_size)
+                offset += read_size
+                if drop_cache:
+                    # Aralık dosyanın başından verilir: çekirdek yalnızca aralığa tamamen giren (büyük) folyoları
+                    # atar, parça sınırına taşan folyolar ancak bir sonraki çağrıda düşer. Zaten atılmış kısım
+                    # önbellekte boş olduğundan yeniden gezmek ucuzdur.
+                    advise_file(fd, "POSIX_FADV_DONTNEED", 0, offset)
+        return hasher.digest()
+    except IOError:
+        return None
+
+def _compare_buffers(size):
+    """Çağıran iş parçacığının bayt karşılaştırması için iki adet size baytlık tamponunu döndürür.
+    memoryview karşılaştırması eleman eleman yapıldığından yavaştır; bytearray'ler memcmp ile karşılaştırılır.
+    """
+    buffers = getattr(_read_buffers, "compare", None)
+    if buffers is None or len(buffers[0]) != size:
+        buffers = (bytearray(size), bytearray(size))
+        _read_buffers.compare = buffers
+    return buffers
+
+def files_identical(path_a, path_b, chunk_size=1024 * 1024, drop_cache=False, limiter=None):
+    """İki dosyayı bayt bayt karşılaştırır (hash doğrulaması). Okunamayan dosya eşit sayılmaz.
+    Okumalar iş parçacığına ait iki tampona readinto ile yapılır.
+    drop_cache: karşılaştırılan her parçanın sayfaları hemen sayfa önbelleğinden atılır (bkz. calculate_digest);
+    çok büyük dosyalarda bile önbellekte yalnızca birkaç parça kadar yer kaplanır.
+    """
+    buffer_a, buffer_b = _compare_buffers(chunk_size)
+    try:
+        if limiter:
+            limiter.consume_file()
+            limiter.consume_file()
+        with open(path_a, 'rb', buffering=0) as file_a, open(path_b, 'rb', buffering=0) as file_b:
+            fd_a, fd_b = file_a.fileno(), file_b.fileno()
+            for fd in (fd_a, fd_b):
+                advise_file(fd, "POSIX_FADV_SEQUENTIAL")
+                if drop_cache:
+                    advise_file(fd, "POSIX_FADV_NOREUSE")
+            offset = 0
+            while True:
+                read_a = file_a.readinto(buffer_a)
+                read_b = file_b.readinto(buffer_b)
+                if limiter:
+                    limiter.consume_bytes(read_a + read_b)
+                if drop_cache: # Bkz. calculate_digest: okunan aralığın tamamı verilir
+                    advise_file(fd_a, "POSIX_FADV_DONTNEED", 0, offset + read_a)
+                    advise_file(fd_b, "POSIX_FADV_DONTNEED", 0, offset + read_b)
+                if read_a != read_b:
+                    return False
+                if read_a == chunk_size:
+                    if buffer_a != buffer_b:
+                        return False
+                else: # Son (kısa) parça
+                    return buffer_a[:read_a] == buffer_b[:read_b]
+                offset += read_a
+    except OSError:
+        return False
+
+# Dizin listeleyen iş parçacığı sayısı. Yerel disklerde 1 (sıralı ve her seferinde aynı sonuç sırası),
+# NFS/SMB gibi gecikmeli ağ bağlantılarında artırılması listelemeyi iş parçacığı sayısıyla ölçekler.
+DEFAULT_SCAN_WORKERS = 1
+
+class CachedDirEntry:
+    """Dizin indeksinden gelen dosyalar için os.DirEntry'nin tarayıcının kullandığı kısmını taklit eder."""
+    __slots__ = ("name", "path", "_stat")
+
+    def __init__(self, dir_path, name, stat_result):
+        self.name = name
+        self.path = os.path.join(dir_path, name)
+        self._stat = stat_result
+
+    def stat(self):
+        return self._stat
+
+class DirectoryIndex:
+    """Dizin listelerini ~/.duplicateagent/dirindex.db içinde saklar (artımlı yeniden tarama için).
+    Bir dizinin mtime_ns ve ctime_ns değerleri önceki taramadakiyle aynıysa içine dosya eklenmemiş/silinmemiş
+    demektir; liste scandir yapılmadan indeksten alınır, yalnızca dosyalar yeniden stat'lanır. Yalnız mtime
+    yetmez: rsync -a, cp -a ve tar dizin mtime'ını geri yükler, ama utime çağrısı ctime'ı yine değiştirir.
+    Tarama başında indeksin yalnızca taranan köklerin altındaki satırları belleğe okunur (birincil anahtar
+    üzerinde aralık sorgusu; daha önce taranmış başka köklerin satırları yüklenmez). Listeleyen iş parçacıkları
+    yalnızca sözlük okuyup yazar, SQLite'a yalnızca save() ile (oluşturan iş parçacığından) dokunulur.
+    """
+
+    # mtime/ctime'ı bu kadar yeni olan dizinler kaydedilmez: aynı zaman diliminde yapılan bir değişiklik
+    # zaman damgasını değiştirmeyebilir ve eski liste yanlışlıkla "değişmemiş" görünebilir.
+    RACY_WINDOW_NS = 2 * 10**9
+
+    def __init__(self, roots, db_path=None):
+        if db_path is None:
+            db_path = os.path.join(os.path.expanduser('~'), '.duplicateagent', 'dirindex.db')
+        self.db_path = db_path
+        self._listings = {}
+        self._updates = {}
+        self._visited = set()
+        self._conn = None
+        try:
+            os.makedirs(os.path.dirname(db_path), exist_ok=True)
+            self._conn = sqlite3.connect(db_path)
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS dirs (
+                    path TEXT PRIMARY KEY, mtime_ns INTEGER, files TEXT, sub_dirs TEXT, ctime_ns INTEGER
+                )""")
+            # ctime sütunu olmayan eski indeks: sütun eklenir, eski satırlar (ctime NULL) hiç eşleşmez ve yeniden listelenir
+            if "ctime_ns" not in [row[1] for row in self._conn.execute("PRAGMA table_info(dirs)")]:
+                self._conn.execute("ALTER TABLE dirs ADD COLUMN ctime_ns INTEGER")
+                self._conn.commit()
+            for root in roots:
+                # Kökün kendisi ve önekiyle başlayan yollar; U+10FFFF her geçerli UTF-8 dizesinden büyük sıralanır
+                prefix = os.path.join(root, '')
+                for path, mtime_ns, ctime_ns, files, sub_dirs in self._conn.execute(
+                        "SELECT path, mtime_ns, ctime_ns, files, sub_dirs FROM dirs WHERE path = ? OR (path >= ? AND path < ?)",
+                        (root, prefix, prefix + '\U0010ffff')):
+                    self._listings[path] = (mtime_ns, ctime_ns, json.loads(files), json.loads(sub_dirs))
+        except (OSError, sqlite3.Error, json.JSONDecodeError) as e: # OSError: ~/.duplicateagent oluşturulamadı
+            print(f"HATA: Dizin indeksi açılamadı: {e}", file=sys.stderr)
+            self._conn = None
+
+    def lookup(self, dir_path, mtime_ns, ctime_ns):
+        """Dizin değişmemişse (dosya_adları, alt_dizin_adları) döndürür, aksi halde None."""
+        self._visited.add(dir_path)
+        listing = self._listings.get(dir_path)
+        if listing and listing[0] == mtime_ns and listing[1] == ctime_ns:
+            return listing[2], listing[3]
+        return None
+
+    def record(self, dir_path, mtime_ns, ctime_ns, file_names, sub_dir_names):
+        if time.time_ns() - max(mtime_ns, ctime_ns) > self.RACY_WINDOW_NS:
+            self._updates[dir_path] = (mtime_ns, ctime_ns, file_names, sub_dir_names)
+
+    def save(self, roots, completed):
+        """Yeni listeleri yazar. Tarama tamamlandıysa, köklerin altında olup bu taramada görülmeyen
+        (silinmiş) dizinlerin kayıtlarını da temizler. Bağlantıyı kapatır.
+        """
+        if self._conn is None:
+            return
+        try:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO dirs (path, mtime_ns, ctime_ns, files, sub_dirs) VALUES (?, ?, ?, ?, ?)",
+                [(path, mtime_ns, ctime_ns, json.dumps(files), json.dumps(sub_dirs))
+                 for path, (mtime_ns, ctime_ns, files, sub_dirs) in self._updates.items()]
+            )
+            if completed:
+                prefixes = tuple(os.path.join(root, '') for root in roots)
+                stale = [(path,) for path in self._listings
+                         if path not in self._visited and (path in roots or path.startswith(prefixes))]
+                self._conn.executemany("DELETE FROM dirs WHERE path=?", stale)
+            self._conn.commit()
+        except sqlite3.Error as e:
+            print(f"HATA: Dizin indeksi yazılamadı: {e}", file=sys.stderr)
+        finally:
+            self._conn.close()
+            self._conn = None
+
+def _scan_single_directory(dir_path, file_filter=None, dir_index=None):
+    """Tek bir dizini os.scandir ile listeler; (normal dosya DirEntry listesi, alt dizin yolları) döndürür.
+    Dosya/dizin ayrımı çekirdeğin döndürdüğü d_type ile yapılır, ek stat çağrısı gerekmez.
+    file_filter'dan geçen dosyalar için entry.stat() burada bir kez çağrılır; DirEntry sonucu önbellekler,
+    böylece stat gecikmesi de listeleyen iş parçacığında harcanır. Stat'ı başarısız olan dosyalar atlanır.
+    dir_index verilirse ve dizinin mtime/ctime'ı değişmemişse liste indeksten alınır (CachedDirEntry).
+    """
+    files = []
+    sub_dirs = []
+    dir_mtime_ns = dir_ctime_ns = None
+
+    if dir_index is not None:
+        try:
+            dir_stats = os.stat(dir_path)
+        except OSError:
+            return files, sub_dirs
+        dir_mtime_ns, dir_ctime_ns = dir_stats.st_mtime_ns, dir_stats.st_ctime_ns
+        cached_listing = dir_index.lookup(dir_path, dir_mtime_ns, dir_ctime_ns)
+        if cached_listing is not None:
+            file_names, sub_dir_names = cached_listing
+            for file_name in file_names:
+                cached_entry = CachedDirEntry(dir_path, file_name, None)
+                if file_filter is None or file_filter(cached_entry):
+                    try:
+                        cached_entry._stat = os.stat(cached_entry.path)
+                    except OSError:
+                        continue
+                    if stat.S_ISREG(cached_entry._stat.st_mode):
+                        files.append(cached_entry)
+            sub_dirs = [os.path.join(dir_path, name) for name in sub_dir_names]
+            return files, sub_dirs
+
+    all_file_names = []
+    try:
+        with os.scandir(dir_path) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir():
+                        if not entry.is_symlink():
+                            sub_dirs.append(entry.path)
+                    elif entry.is_file():
+                        all_file_names.append(entry.name)
+                        if file_filter is None or file_filter(entry):
+                            entry.stat()
+                            files.append(entry)
+                except OSError:
+                    continue
+    except OSError:
+        return files, sub_dirs
+
+    if dir_index is not None:
+        # İndekse filtrelenmemiş liste yazılır; sonraki taramada filtreler değişebilir
+        dir_index.record(dir_path, dir_mtime_ns, dir_ctime_ns, all_file_names, [os.path.basename(sub_dir) for sub_dir in sub_dirs])
+    return files, sub_dirs
+
+def walk_files(base_dir, file_filter=None, dir_index=None):
+    """Dizin ağacını gezer ve file_filter'dan geçen normal dosyaların DirEntry nesnelerini üretir.
+    os.walk gibi dizin sembolik bağlarını izlemez ve aynı (ön-sıralı) gezinme sırasını korur;
+    okunamayan dizinler sessizce atlanır.
+    """
+    stack = [base_dir]
+    while stack:
+        files, sub_dirs = _scan_single_directory(stack.pop(), file_filter, dir_index)
+        yield from files
+        stack.extend(reversed(sub_dirs))
+
+def walk_files_parallel(base_dirs, workers, file_filter=None, should_continue=lambda: True, dir_index=None):
+    """Birden çok kökü ve alt ağaçlarını eşzamanlı listeler: bir dizin kuyruğunu besleyen scandir
+    iş parçacığı havuzu. Biten her dizinin dosyaları hemen üretilir (boyut gruplamasına akar),
+    alt dizinleri kuyruğa eklenir. Dosya sırası tamamlanma sırasına bağlıdır, yani sabit değildir.
+    """
+    executor = ThreadPoolExecutor(max_workers=max(1, workers))
+    in_flight = set()
+    try:
+        for base_dir in base_dirs:
+            in_flight.add(executor.submit(_scan_single_directory, base_dir, file_filter, dir_index))
+
+        while in_flight:
+            if not should_continue():
+                return
+            done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                files, sub_dirs = future.result()
+                for sub_dir in sub_dirs:
+                    in_flight.add(executor.submit(_scan_single_directory, sub_dir, file_filter, dir_index))
+                yield from files
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+class InotifyWatcher:
+    """Linux inotify arabirimi (libc üzerinden ctypes ile).
+    inotify özyinelemeli değildir; add_tree ağacın her dizinine ayrı izleme (watch) ekler.
+    Linux dışında veya libc'de inotify yoksa available False olur.
+    """
+
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_FROM = 0x00000040
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_DELETE = 0x00000200
+    IN_DELETE_SELF = 0x00000400
+    IN_Q_OVERFLOW = 0x00004000
+    IN_IGNORED = 0x00008000
+    IN_ONLYDIR = 0x01000000
+    IN_ISDIR = 0x40000000
+    WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE | IN_DELETE_SELF | IN_ONLYDIR
+
+    EVENT_HEADER = struct.Struct('iIII') # wd, mask, cookie, len (ardından len baytlık ad)
+
+    def __init__(self):
+        self.fd = -1
+        self._dirs_by_wd = {}
+        self._wd_by_dir = {}
+        self._limit_reported = False
+        try:
+            libc = ctypes.CDLL(None, use_errno=True)
+            self._inotify_add_watch = libc.inotify_add_watch
+            self._inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+            self._inotify_rm_watch = libc.inotify_rm_watch
+            self._inotify_rm_watch.argtypes = [ctypes.c_int, ctypes.c_int]
+            self.fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        except (OSError, AttributeError, TypeError):
+            self.fd = -1
+
+    @property
+    def available(self):
+        return self.fd >= 0
+
+    def add(self, dir_path):
+        wd = self._inotify_add_watch(self.fd, os.fsencode(dir_path), self.WATCH_MASK)
+        if wd < 0:
+            error = ctypes.get_errno()
+            if error == errno.ENOSPC and not self._limit_reported: # Ağacın kalan her dizini için tekrarlanmasın
+                self._limit_reported = True
+                print(f"HATA: inotify izleme sınırına ulaşıldı (fs.inotify.max_user_watches): {dir_path}", file=sys.stderr)
+            return False
+        self._dirs_by_wd[wd] = dir_path
+        self._wd_by_dir[dir_path] = wd
+        return True
+
+    def add_tree(self, base_dir):
+        """base_dir ve altındaki tüm dizinleri izlemeye alır (dizin sembolik bağları izlenmez)."""
+        stack = [base_dir]
+        while stack:
+            dir_path = stack.pop()
+            if self.add(dir_path):
+                stack.extend(_scan_single_directory(dir_path, lambda entry: False)[1])
+
+    def remove_tree(self, dir_path):
+        """Taşınan/silinen dizinin ve alt dizinlerinin izlemelerini bırakır."""
+        prefix = os.path.join(dir_path, '')
+        for watched_dir in [d for d in self._wd_by_dir if d == dir_path or d.startswith(prefix)]:
+            wd = self._wd_by_dir.pop(watched_dir)
+            self._dirs_by_wd.pop(wd, None)
+            self._inotify_rm_watch(self.fd, wd)
+
+    def read_events(self, timeout):
+        """Bekleyen olayları (dizin_yolu, ad, maske) listesi olarak döndürür; timeout saniye kadar bekler.
+        İkinci değer, çekirdek olay kuyruğu taştıysa True'dur (olaylar kaybolmuştur).
+        """
+        events = []
+        overflowed = False
+        if not select.select([self.fd], [], [], timeout)[0]:
+            return events, overflowed
+        while True:
+            try:
+                buffer = os.read(self.fd, 65536)
+            except BlockingIOError:
+                break
+            offset = 0
+            while offset < len(buffer):
+                wd, mask, cookie, name_length = self.EVENT_HEADER.unpack_from(buffer, offset)
+                offset += self.EVENT_HEADER.size
+                name = os.fsdecode(buffer[offset:offset + name_length].rstrip(b'\0'))
+                offset += name_length
+                if mask & self.IN_Q_OVERFLOW:
+                    overflowed = True
+                elif mask & self.IN_IGNORED:
+                    dir_path = self._dirs_by_wd.pop(wd, None)
+                    if dir_path is not None and self._wd_by_dir.get(dir_path) == wd:
+                        del self._wd_by_dir[dir_path]
+                elif wd in self._dirs_by_wd and name:
+                    events.append((self._dirs_by_wd[wd], name, mask))
+        return events, overflowed
+
+    def close(self):
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+
+def is_rotational_device(st_dev):
+    """st_dev değerine karşılık gelen blok aygıtın dönen disk (HDD) olup olmadığını /sys üzerinden bulur.
+    Bölümler (sda1 gibi) için üst aygıtın kuyruk bilgisine bakılır. Bilinmiyorsa (NFS, tmpfs, Windows) None döner.
+    """
+    try:
+        sys_path = os.path.realpath(f"/sys/dev/block/{os.major(st_dev)}:{os.minor(st_dev)}")
+    except (AttributeError, ValueError):
+        return None
+
+    for candidate in (sys_path, os.path.dirname(sys_path)):
+        rotational_path = os.path.join(candidate, 'queue', 'rotational')
+        if os.path.exists(rotational_path):
+            try:
+                with open(rotational_path, 'r') as f:
+                    return f.read().strip() == '1'
+            except OSError:
+                return None
+    return None
+
+class LoadThrottle:
+    """Sunucunun yüküne göre hash eşzamanlılığını kendiliğinden ayarlar: /proc/stat işlemci sayaçları ve
+    /proc/pressure/io (PSI) saniyede bir okunur; sunucu meşgulse eşzamanlı okuma sayısı yarıya iner, boştaysa
+    birer birer artar (AIMD). Kararlar sönümlü ortalamalarla (loadavg, avg10) değil, son örnekleme aralığındaki
+    sayaç farklarıyla verilir: bir dakikalık ortalama taramanın az önceki kendi yükünü hâlâ taşır ve onu başka
+    işlere yükleyip taramayı gereksiz yere durdururdu. Taramanın kendi işlemci zamanı (os.times) aynı aralıkta
+    ölçülüp düşülür; diğer programlar işlemciyi dolduruyorsa okuma tamamen durur (0), yük kalkınca yeniden başlar.
+    Ne /proc/stat ne PSI okunabiliyorsa (Linux dışı) her zaman en yüksek eşzamanlılığa izin verir.
+    """
+
+    SAMPLE_INTERVAL = 1.0 # saniye
+    CPU_BUSY_HIGH = 0.9 # Diğer işlerin son aralıkta, taramanın kullanmadığı işlemci kapasitesinden aldığı pay
+    CPU_BUSY_LOW = 0.6
+    IO_PRESSURE_HIGH = 30.0 # Son aralıkta görevlerin G/Ç beklerken geçirdiği zaman yüzdesi (PSI "some")
+    IO_PRESSURE_LOW = 10.0
+
+    def __init__(self, max_concurrency, on_change=None):
+        self.max_concurrency = max(1, max_concurrency)
+        self.on_change = on_change or (lambda concurrency: None)
+        self.available = os.path.exists('/proc/stat') or os.path.exists('/proc/pressure/io')
+        self.concurrency = 1 if self.available else self.max_concurrency # Temkinli başla, boşta hızla tırman
+        self._clock_ticks = os.sysconf('SC_CLK_TCK') if hasattr(os, 'sysconf') else 100
+        self._last_sample = 0.0
+        self._last_cpu = None # (toplam_tik, meşgul_tik, kendi_işlemci_saniyesi)
+        self._last_io_stall = None # (PSI "some total" mikrosaniye, monotonic zaman)
+
+    @staticmethod
+    def read_cpu_ticks():
+        """/proc/stat "cpu" satırından (toplam, meşgul) tik sayıları; okunamazsa None. Boşta ve iowait meşgul sayılmaz."""
+        try:
+            with open('/proc/stat', 'r') as f:
+                fields = [int(value) for value in f.readline().split()[1:9]] # user..steal; guest zaten user'a dahil
+        except (OSError, ValueError):
+            return None
+        if len(fields) < 5:
+            return None
+        total = sum(fields)
+        return total, total - fields[3] - fields[4]
+
+    @staticmethod
+    def read_io_stall():
+        """/proc/pressure/io "some total" değeri (G/Ç beklemesinin toplam mikrosaniyesi); PSI yoksa None."""
+        try:
+            with open('/proc/pressure/io', 'r') as f:
+                for line in f:
+                    if line.startswith('some '):
+                        fields = dict(field.split('=', 1) for field in line.split()[1:])
+                        return int(fields['total'])
+        except (OSError, ValueError, KeyError):
+            pass
+        return None
+
+    def update(self):
+        """Son örneklemeden SAMPLE_INTERVAL geçtiyse yükü yeniden okuyup eşzamanlılığı ayarlar.
+        İzin verilen eşzamanlı okuma sayısını döndürür (0 = şimdilik bekle). İlk çağrı yalnızca sayaçları kaydeder.
+        """
+        now = time.monotonic()
+        if not self.available or now - self._last_sample < self.SAMPLE_INTERVAL:
+            return self.concurrency
+        self._last_sample = now
+
+        cpu_ticks = self.read_cpu_ticks()
+        own_cpu = sum(os.times()[:2]) # Tüm iş parçacıklarıyla bu sürecin kullanıcı + çekirdek zamanı
+        io_stall = self.read_io_stall()
+        last_cpu, last_io_stall = self._last_cpu, self._last_io_stall
+        self._last_cpu = (*cpu_ticks, own_cpu) if cpu_ticks else None
+        self._last_io_stall = (io_stall, now) if io_stall is not None else None
+        if last_cpu is None and last_io_stall is None:
+            return self.concurrency
+
+        others_busy = 0.0
+        if cpu_ticks and last_cpu:
+            total_seconds = (cpu_ticks[0] - last_cpu[0]) / self._clock_ticks
+            busy_seconds = (cpu_ticks[1] - last_cpu[1]) / self._clock_ticks
+            own_seconds = own_cpu - last_cpu[2]
+            others_seconds = max(0.0, busy_seconds - own_seconds)
+            # Taramanın kullanmadığı kapasitenin ne kadarını diğer işler kullandı: tarama işlemciyi paylaşırken
+            # diğer işler ancak adil paylarını alabilir, tüm kapasiteye oranlamak onları hiç "meşgul" göstermezdi.
+            # Tarama işlemcinin neredeyse tamamını kullanıyorsa çekirdek iş parçacıklarının birkaç tiki oranı
+            # şişirmesin diye payda kapasitenin onda birinden küçük alınmaz.
+            free_seconds = max(total_seconds - own_seconds, 0.1 * total_seconds)
+            if free_seconds > 0:
+                others_busy = min(1.0, others_seconds / free_seconds)
+        io_pressure = 0.0
+        if io_stall is not None and last_io_stall:
+            io_pressure = min(100.0, (io_stall - last_io_stall[0]) / 1e4 / max(now - last_io_stall[1], 1e-3))
+
+        concurrency = self.concurrency
+        if others_busy > self.CPU_BUSY_HIGH:
+            # Başka işler işlemciyi dolduruyor: yarıya in, en sonunda tamamen dur
+            concurrency //= 2
+        elif io_pressure > self.IO_PRESSURE_HIGH:
+            # G/Ç baskısına taramanın kendi okumaları da katkı verir; bu yüzden tek okuyucunun altına inilmez
+            concurrency = max(1, concurrency // 2)
+        elif others_busy < self.CPU_BUSY_LOW and io_pressure < self.IO_PRESSURE_LOW:
+            concurrency = min(self.max_concurrency, concurrency + 1)
+
+        if concurrency != self.concurrency:
+            self.concurrency = concurrency
+            self.on_change(concurrency)
+        return concurrency
+
+class DeviceIOScheduler:
+    """Aday dosyaları aygıt (st_dev) bazında kuyruklara ayırıp kuyrukları paralel boşaltır.
+    Her dönen disk tek bir sıralı okuyucuyla sınırlanır (kafa sıçramasın diye);
+    SSD ve bilinmeyen aygıtlar (ağ bağlantıları dahil) hash havuzu kadar eşzamanlı okuma alır.
+    """
+
+    def __init__(self, workers, throttle=None):
+        self.workers = max(1, workers)
+        self.throttle = throttle # Verilirse (LoadThrottle) toplam eşzamanlı okuma sayısını sunucu yüküne göre sınırlar
+        self._rotational = {}
+
+    def _is_rotational(self, st_dev):
+        if st_dev not in self._rotational:
+            self._rotational[st_dev] = bool(is_rotational_device(st_dev))
+        return self._rotational[st_dev]
+
+    def device_limit(self, st_dev):
+        """Aygıt başına eşzamanlı okuma sınırını döndürür (sonuç önbelleklenir)."""
+        return 1 if self._is_rotational(st_dev) else self.workers
+
+    def read_chunk_size(self, st_dev):
+        """Aygıta göre tam hash okuma parça boyutu: dönen disklerde daha uzun sıralı okumalar."""
+        return HASH_READ_CHUNK_ROTATIONAL if self._is_rotational(st_dev) else HASH_READ_CHUNK
+
+    def run(self, jobs, func, on_result, should_continue):
+        """jobs: (st_dev, args) listesi. Her iş func(*args) ile kendi aygıtının havuzunda çalışır,
+        sonuç on_result(sıra_no, sonuç) ile çağıran iş parçacığında bildirilir.
+        should_continue() False dönerse bekleyen işler iptal edilir ve False döndürülür.
+        Her dosya bitiminde (ve kısıtlayıcı varsa en geç saniyede bir) kısıtlayıcının kararı yeniden alınır.
+        """
+        throttle = self.throttle
+        queues = {}
+        for index, (st_dev, args) in enumerate(jobs):
+            if st_dev not in queues:
+                queues[st_dev] = deque()
+            queues[st_dev].append((index, args))
+
+        executors = {st_dev: ThreadPoolExecutor(max_workers=self.device_limit(st_dev)) for st_dev in queues}
+        in_flight_by_device = {st_dev: 0 for st_dev in queues}
+        in_flight = {}
+
+        try:
+            while queues or in_flight:
+                if not should_continue():
+                    return False
+                total_limit = throttle.update() if throttle else None
+
+                # Her aygıtın kuyruğunu kendi sınırının biraz ötesine kadar doldur
+                for st_dev in list(queues):
+                    queue = queues[st_dev]
+                    limit = self.device_limit(st_dev) * 2
+                    while queue and in_flight_by_device[st_dev] < limit and (total_limit is None or len(in_flight) < total_limit):
+                        index, args = queue.popleft()
+                        future = executors[st_dev].submit(func, *args)
+                        in_flight[future] = (index, st_dev)
+                        in_flight_by_device[st_dev] += 1
+                    if not queue:
+                        del queues[st_dev]
+
+                if not in_flight:
+                    time.sleep(throttle.SAMPLE_INTERVAL) # Sunucu meşgul, tarama duraklatıldı
+                    continue
+                # Kısıtlayıcı varsa uzun dosyalar sürerken de eşzamanlılık artırılabilsin diye zaman aşımıyla beklenir
+                done, _ = wait(list(in_flight), timeout=throttle.SAMPLE_INTERVAL if throttle else None,
+                               return_when=FIRST_COMPLETED)
+                for future in done:
+                    index, st_dev = in_flight.pop(future)
+                    in_flight_by_device[st_dev] -= 1
+                    on_result(index, future.result())
+            return True
+        finally:
+            for executor in executors.values():
+                executor.shutdown(wait=True, cancel_futures=True)
+
+class RateLimiter:
+    """Hash okumalarını saniyedeki bayt ve dosya sayısıyla sınırlar (sanal zamanlı jeton kovası).
+    Tüm hash iş parçacıkları aynı nesneyi paylaşır; sınırlar tarama sürerken başka bir iş parçacığından
+    (ör. GUI) set_limits ile değiştirilebilir ve bekleyenlere hemen uygulanır. 0 = sınırsız.
+    """
+
+    BURST_SECONDS = 0.25 # Boşta kalan süreden en çok bu kadarlık iş birden yapılabilir
+    SLEEP_SLICE = 0.1 # Uzun beklemeler dilimlenir ki iptal ve sınır değişikliği gecikmesin
+
+    def __init__(self, bytes_per_second=0, files_per_second=0):
+        self._lock = threading.Lock()
+        self._cancelled = False
+        self.set_limits(bytes_per_second, files_per_second)
+
+    def set_limits(self, bytes_per_second, files_per_second):
+        with self._lock:
+            self.bytes_per_second = max(0, bytes_per_second)
+            self.files_per_second = max(0, files_per_second)
+            now = time.monotonic()
+            self._next_time = {"bytes": now, "files": now}
+            self._generation = getattr(self, "_generation", 0) + 1
+
+    @property
+    def active(self):
+        return bool(self.bytes_per_second or self.files_per_second)
+
+    def consume_bytes(self, count):
+        """count bayt okunduğunu bildirir; sınır aşıldıysa gereken süre kadar bekletir."""
+        self._consume("bytes", count)
+
+    def consume_file(self):
+        """Bir dosyanın okunmak üzere açıldığını bildirir."""
+        self._consume("files", 1)
+
+    def cancel(self):
+        """Bekleyen ve gelecek tüm beklemeleri kısa keser (tarama durdurulurken)."""
+        self._cancelled = True
+
+    def _consume(self, kind, amount):
+        with self._lock:
+            rate = self.bytes_per_second if kind == "bytes" else self.files_per_second
+            if not rate or self._cancelled:
+                return
+            now = time.monotonic()
+            next_time = max(self._next_time[kind], now - self.BURST_SECONDS) + amount / rate
+            self._next_time[kind] = next_time
+            generation = self._generation
+            wake_time = next_time - self.BURST_SECONDS
+
+        while not self._cancelled and generation == self._generation:
+            delay = wake_time - time.monotonic()
+            if delay <= 0:
+                break
+            time.sleep(min(delay, self.SLEEP_SLICE))
+
+# ioprio_set sistem çağrısı numaraları (glibc sarmalayıcı sunmuyor)
+_IOPRIO_SET_SYSCALLS = {"x86_64": 251, "i386": 289, "i686": 289, "aarch64": 30, "riscv64": 30,
+                        "armv7l": 314, "ppc64le": 273, "s390x": 282}
+_IOPRIO_WHO_PROCESS = 1
+_IOPRIO_CLASS_IDLE = 3
+_IOPRIO_CLASS_SHIFT = 13
+
+def lower_thread_priority(nice_level=0, io_idle=False):
+    """Çağıran iş parçacığının nice değerini nice_level'a yükseltir ve io_idle ise G/Ç önceliğini
+    "idle" sınıfına (ionice -c3) alır: disk yalnızca başka kimse kullanmıyorken okunur. Linux'ta bu
+    ayarlar iş parçacığı başınadır ve sonradan açılan iş parçacıklarına (hash havuzları) miras kalır;
+    bu yüzden taramayı yürüten iş parçacığında, havuzlar kurulmadan önce çağrılmalıdır.
+    Desteklenmeyen platformlarda veya yetki yoksa uyarı basıp geçer.
+    """
+    thread_id = threading.get_native_id()
+    if nice_level > 0 and hasattr(os, 'setpriority'):
+        try:
+            if os.getpriority(os.PRIO_PROCESS, thread_id) < nice_level:
+                os.setpriority(os.PRIO_PROCESS, thread_id, nice_level)
+        except OSError as e:
+            print(f"HATA: nice değeri ayarlanamadı: {e}", file=sys.stderr)
+
+    if io_idle:
+        syscall_number = _IOPRIO_SET_SYSCALLS.get(os.uname().machine) if hasattr(os, 'uname') else None
+        if syscall_number is None:
+            print("HATA: G/Ç önceliği bu platformda ayarlanamıyor", file=sys.stderr)
+            return
+        libc = ctypes.CDLL(None, use_errno=True)
+        if libc.syscall(syscall_number, _IOPRIO_WHO_PROCESS, thread_id, _IOPRIO_CLASS_IDLE << _IOPRIO_CLASS_SHIFT) != 0:
+            print(f"HATA: G/Ç önceliği ayarlanamadı: {os.strerror(ctypes.get_errno())}", file=sys.stderr)
+
+class HashCache:
+    """Hesaplanan hash'leri ~/.duplicateagent/hashcache.db içinde (algoritma, st_dev, st_ino, boyut, mtime_ns)
+    anahtarıyla saklar. Dosya değişmedikçe yeniden taramada okunmaz. Her satır ilk blok, son blok ve tam hash
+    sütunlarını ayrı tutar; farklı algoritmaların özetleri birbirine karışmaz.
+    Yalnızca oluşturulduğu iş parçacığından kullanılmalıdır.
+    """
+
+    COLUMNS = ("head_hash", "tail_hash", "full_hash")
+
+    def __init__(self, db_path=None, algorithm="md5"):
+        if db_path is None:
+            db_path = os.path.join(os.path.expanduser('~'), '.duplicateagent', 'hashcache.db')
+        self.db_path = db_path
+        self.algorithm = algorithm
+        self.scan_started = time.time()
+        self._conn = None
+        try:
+            os.makedirs(os.path.dirname(db_path), exist_ok=True)
+            self._conn = sqlite3.connect(db_path)
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS digests (
+                    algorithm TEXT, dev INTEGER, ino INTEGER, size INTEGER, mtime_ns INTEGER,
+                    path TEXT, last_seen REAL,
+                    head_hash TEXT, tail_hash TEXT, full_hash TEXT,
+                    PRIMARY KEY (algorithm, dev, ino, size, mtime_ns)
+                )""")
+            # Algoritma sütunu olmayan eski önbellek (yalnızca MD5) bir kez yeni tabloya taşınır
+            if self._conn.execute("SELECT 1 FROM sqlite_master WHERE type='table' AND name='hashes'").fetchone():
+                self._conn.execute("""
+                    INSERT OR IGNORE INTO digests
+                    SELECT 'md5', dev, ino, size, mtime_ns, path, last_seen, head_hash, tail_hash, full_hash FROM hashes""")
+                self._conn.execute("DROP TABLE hashes")
+            self._conn.commit()
+        except (OSError, sqlite3.Error) as e: # OSError: ~/.duplicateagent oluşturulamadı
+            print(f"HATA: Hash önbelleği açılamadı: {e}", file=sys.stderr)
+            self._conn = None
+
+    def lookup(self, column, stat_keys):
+        """Verilen stat anahtarları için önbellekteki değerleri {stat_key: digest} olarak döndürür."""
+        found = {}
+        if self._conn is None:
+            return found
+        try:
+            for stat_key in stat_keys:
+                row = self._conn.execute(
+                    f"SELECT {column} FROM digests WHERE algorithm=? AND dev=? AND ino=? AND size=? AND mtime_ns=?",
+                    (self.algorithm, *stat_key)
+                ).fetchone()
+                if row and row[0]:
+                    found[stat_key] = row[0]
+        except sqlite3.Error as e:
+            print(f"HATA: Hash önbelleği okunamadı: {e}", file=sys.stderr)
+        return found
+
+    def store(self, column, records):
+        """records: (stat_key, dosya_yolu, digest) dizisi (üreteç olabilir). Satırları ekler ya da günceller, son görülme zamanını tazeler."""
+        if self._conn is None or not records:
+            return
+        now = time.time()
+        try:
+            self._conn.executemany(
+                f"""INSERT INTO digests (algorithm, dev, ino, size, mtime_ns, path, last_seen, {column})
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT (algorithm, dev, ino, size, mtime_ns)
+                    DO UPDATE SET {column}=excluded.{column}, path=excluded.path, last_seen=excluded.last_seen""",
+                ((self.algorithm, *stat_key, path, now, digest) for stat_key, path, digest in records)
+            )
+            self._conn.commit()
+        except sqlite3.Error as e:
+            print(f"HATA: Hash önbelleği yazılamadı: {e}", file=sys.stderr)
+
+    def evict_stale(self):
+        """Bu taramada dokunulmamış satırlardan (tüm algoritmalar), dosyası artık olmayan ya da değişmiş olanları siler."""
+        if self._conn is None:
+            return
+        try:
+            rows = self._conn.execute(
+                "SELECT algorithm, dev, ino, size, mtime_ns, path FROM digests WHERE last_seen < ?", (self.scan_started,)
+            ).fetchall()
+            stale = []
+            for algorithm, dev, ino, size, mtime_ns, path in rows:
+                try:
+                    st = os.stat(path)
+                    if (st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns) == (dev, ino, size, mtime_ns):
+                        continue
+                except OSError:
+                    pass
+                stale.append((algorithm, dev, ino, size, mtime_ns))
+            self._conn.executemany("DELETE FROM digests WHERE algorithm=? AND dev=? AND ino=? AND size=? AND mtime_ns=?", stale)
+            self._conn.commit()
+        except sqlite3.Error as e:
+            print(f"HATA: Hash önbelleği temizlenemedi: {e}", file=sys.stderr)
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+def format_size(size):
+    """Bayt cinsinden boyutu okunabilir formata çevirir."""
+    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
+        if size < 1024.0:
+            return f"{size:3.1f} {unit}"
+        size /= 1024.0
+    return f"{size:3.1f} PB"
+
+class GroupExporter:
+    """Kopya gruplarını geldikçe yazar; çıktı ne kadar büyürse büyüsün gruplar bellekte biriktirilmez.
+    Biçimler: jsonl (satır başına bir grup), csv (dosya başına bir satır), json (eleman eleman yazılan
+    tek dizi), text (okunabilir liste). Grup başına hash, algorithm, size_bytes ve files yazılır; sabit bağ
+    grupları "linked", izleme güncellemeleri "updated" ile işaretlenir.
+    """
+
+    FORMATS = ("text", "json", "jsonl", "csv")
+    CSV_HEADER = ["hash", "size_bytes", "path", "linked", "algorithm"]
+
+    def __init__(self, output, export_format, flush_each=False):
+        """output bir dosya yolu veya açık metin akışıdır (ör. sys.stdout); yalnızca yolu verilen dosya kapatılır.
+        flush_each, her gruptan sonra akışı boşaltır (canlı izleme çıktısını okuyan araçlar için).
+        """
+        if export_format not in self.FORMATS:
+            raise ValueError(f"Bilinmeyen dışa aktarma biçimi: {export_format}")
+        self.export_format = export_format
+        self.flush_each = flush_each
+        self._owns_output = isinstance(output, str)
+        self.output = open(output, 'w', encoding='utf-8', newline='') if self._owns_output else output
+        self.group_count = 0
+        if export_format == "csv":
+            self._csv_writer = csv.writer(self.output, lineterminator="\n")
+            self._csv_writer.writerow(self.CSV_HEADER)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def write_group(self, group):
+        record = {"hash": group["hash"], "size_bytes": group["size_bytes"], "files": list(group["files"])}
+        if group.get("algorithm"):
+            record["algorithm"] = group["algorithm"] # Sabit bağ gruplarında yok: içerik hash'lenmedi
+        for flag in ("linked", "updated"):
+            if group.get(flag, False):
+                record[flag] = True
+
+        if self.export_format == "jsonl":
+            self.output.write(json.dumps(record, ensure_ascii=False) + "\n")
+        elif self.export_format == "json":
+            self.output.write(("[\n" if self.group_count == 0 else ",\n") + json.dumps(record, ensure_ascii=False))
+        elif self.export_format == "csv":
+            linked = 1 if record.get("linked") else 0
+            algorithm = record.get("algorithm", "")
+            self._csv_writer.writerows([record["hash"], record["size_bytes"], file_path, linked, algorithm] for file_path in record["files"])
+        else:
+            note = "".join(f" ({flag})" for flag in ("linked", "updated") if record.get(flag))
+            if record.get("algorithm"):
+                note = f" [{record['algorithm']}]" + note
+            self.output.write(f"# {record['hash']} {record['size_bytes']} bytes, {len(record['files'])} files{note}\n")
+            self.output.write("".join(file_path + "\n" for file_path in record["files"]) + "\n")
+
+        self.group_count += 1
+        if self.flush_each:
+            self.output.flush()
+
+    def close(self):
+        if self.output is None:
+            return
+        if self.export_format == "json":
+            self.output.write("[]\n" if self.group_count == 0 else "\n]\n")
+        self.output.flush()
+        if self._owns_output:
+            self.output.close()
+        self.output = None
+class FileTable:
+    """Taranan dosyaların sütunlu, kompakt tablosu; dosyalar eklenme sırasındaki indeksleriyle anılır.
+    Her yol ayrı bir str olarak tutulmaz: dizin önekleri bir kez saklanır (interned), dosya adları tek bir
+    bayt bloğunda durur; boyut, aygıt, inode ve mtime array sütunlarındadır. Tam yol yalnızca
+    gerektiğinde (hash'lenirken, sonuç gruplarında) path() ile kurulur.
+    """
+
+    def __init__(self):
+        self.dirs = [] # dizin no -> dizin yolu
+        self._dir_ids = {}
+        self._last_dir = None
+        self._last_dir_id = 0
+        self.dir_ids = array('I')
+        self._names = bytearray()
+        self._name_ends = array('Q')
+        self.sizes = array('Q')
+        self.devs = array('Q')
+        self.inodes = array('Q')
+        self.mtimes = array('q')
+
+    def __len__(self):
+        return len(self.sizes)
+
+    def add(self, dir_path, name, file_stats):
+        # Listeleyici dosyaları dizin dizin ürettiği için art arda gelen dosyalar çoğunlukla aynı dizindedir
+        if dir_path != self._last_dir:
+            dir_id = self._dir_ids.get(dir_path)
+            if dir_id is None:
+                dir_id = len(self.dirs)
+                self._dir_ids[dir_path] = dir_id
+                self.dirs.append(dir_path)
+            self._last_dir, self._last_dir_id = dir_path, dir_id
+        self.dir_ids.append(self._last_dir_id)
+        self._names += name.encode('utf-8', 'surrogateescape')
+        self._name_ends.append(len(self._names))
+        self.sizes.append(file_stats.st_size)
+        self.devs.append(file_stats.st_dev)
+        self.inodes.append(file_stats.st_ino)
+        self.mtimes.append(file_stats.st_mtime_ns)
+        return len(self.sizes) - 1
+
+    def path(self, index):
+        name_start = self._name_ends[index - 1] if index else 0
+        name = self._names[name_start:self._name_ends[index]].decode('utf-8', 'surrogateescape')
+        return os.path.join(self.dirs[self.dir_ids[index]], name)
+
+    def stat_key(self, index):
+        return (self.devs[index], self.inodes[index], self.sizes[index], self.mtimes[index])
+
+# ----------------------------------------------------------------------
+# KAYITLI TARAMA OTURUMLARI
+# ----------------------------------------------------------------------
+
+class ScanSession:
+    """Kaydedilmiş bir tarama oturumunu (.dasession) mmap ile açar; dosya yolları ve stat anlık görüntüleri
+    ancak okundukları anda çözülür, böylece milyonlarca satırlık oturum anında açılır.
+
+    Dosya düzeni (küçük uçlu): başlık, JSON meta (seçenekler, hedef dizinler, hash algoritması, kayıt zamanı),
+    grup kayıtları, dosya kayıtları, dizin kayıtları ve en sonda dize bloğu. Yollar dizin öneki +
+    dosya adı olarak saklanır; aynı dizindeki dosyalar öneki paylaşır.
+    """
+
+    MAGIC = b"DASESS01"
+    HEADER = struct.Struct('<8sQQQQQQQQ') # sihirli, meta ofs/uzunluk, grup/dosya/dizin sayısı, grup/dosya/dizin ofs
+    GROUP_RECORD = struct.Struct('<QQIQII') # boyut, ilk dosya, dosya sayısı, hash ofs/uzunluk, bayraklar
+    FILE_RECORD = struct.Struct('<IQIQQQq') # dizin no, ad ofs/uzunluk, st_dev, st_ino, st_size, st_mtime_ns
+    DIR_RECORD = struct.Struct('<QI') # dizin yolu ofs/uzunluk
+    FLAG_LINKED = 1
+
+    def __init__(self, file_path):
+        self.session_path = file_path
+        with open(file_path, 'rb') as file:
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            header = self.HEADER.unpack_from(self._map, 0)
+        except struct.error:
+            header = (None,)
+        if header[0] != self.MAGIC:
+            self._map.close()
+            raise ValueError(f"Geçerli bir oturum dosyası değil: {file_path}")
+        (_, meta_offset, meta_length, self.group_count, self.file_count, self.dir_count,
+         self._groups_offset, self._files_offset, self._dirs_offset) = header
+        self._strings_offset = self._dirs_offset + self.dir_count * self.DIR_RECORD.size
+        # Bölümler sırayla dizilir; yarıda kesilmiş ya da bozuk dosya burada reddedilir, kayıtlar okunurken değil
+        if not (self.HEADER.size <= meta_offset and meta_offset + meta_length <= self._groups_offset
+                and self._groups_offset + self.group_count * self.GROUP_RECORD.size <= self._files_offset
+                and self._files_offset + self.file_count * self.FILE_RECORD.size <= self._dirs_offset
+                and self._strings_offset <= len(self._map)):
+            self._map.close()
+            raise ValueError(f"Oturum dosyası bozuk veya eksik: {file_path}")
+        try:
+            meta = json.loads(self._map[meta_offset:meta_offset + meta_length].decode('utf-8'))
+        except ValueError: # JSONDecodeError ve UnicodeDecodeError
+            self._map.close()
+            raise ValueError(f"Oturum dosyası bozuk veya eksik: {file_path}")
+        self.options = meta.get("options", {})
+        self.target_dirs = meta.get("target_dirs", [])
+        self.saved_at = meta.get("saved_at", "")
+        self.hash_algorithm = meta.get("hash_algorithm") or "md5" # Algoritma kaydı olmayan eski oturumlar MD5'tir
+        self._dir_cache = {}
+
+    def _string(self, offset, length):
+        start = self._strings_offset + offset
+        return self._map[start:start + length].decode('utf-8', 'surrogateescape')
+
+    def _dir_path(self, dir_id):
+        dir_path = self._dir_cache.get(dir_id)
+        if dir_path is None:
+            dir_path = self._string(*self.DIR_RECORD.unpack_from(self._map, self._dirs_offset + dir_id * self.DIR_RECORD.size))
+            self._dir_cache[dir_id] = dir_path
+        return dir_path
+
+    def file_path(self, file_index):
+        dir_id, name_offset, name_length = self.FILE_RECORD.unpack_from(self._map, self._files_offset + file_index * self.FILE_RECORD.size)[:3]
+        return os.path.join(self._dir_path(dir_id), self._string(name_offset, name_length))
+
+    def file_stat(self, file_index):
+        return self.FILE_RECORD.unpack_from(self._map, self._files_offset + file_index * self.FILE_RECORD.size)[3:]
+
+    def groups(self):
+        """Grup sözlüklerini döndürür; "files" ve "stats" oturum dosyasından tembel okunan dizilerdir.
+        Dosya kayıtlarının veya dize bloğunun dışını gösteren grup kaydında ValueError verir.
+        """
+        groups = []
+        groups_end = self._groups_offset + self.group_count * self.GROUP_RECORD.size
+        strings_offset = self._strings_offset
+        path_getter, stat_getter = self.file_path, self.file_stat
+        algorithm = self.hash_algorithm
+        gc_was_enabled = gc.isenabled()
+        gc.disable() # Milyonlarca küçük nesne kurulurken döngüsel çöp toplayıcı boşuna tekrar tekrar çalışmasın
+        try:
+            for size_bytes, first_file, file_count, hash_offset, hash_length, flags in self.GROUP_RECORD.iter_unpack(
+                    self._map[self._groups_offset:groups_end]):
+                hash_start = strings_offset + hash_offset
+                if first_file + file_count > self.file_count or hash_start + hash_length > len(self._map):
+                    raise ValueError(f"Oturum dosyası bozuk veya eksik: {self.session_path}")
+                group = {
+                    "hash": self._map[hash_start:hash_start + hash_length].decode('utf-8', 'surrogateescape'),
+                    "size_bytes": size_bytes,
+                    "size": format_size(size_bytes),
+                    "files": _SessionColumn(path_getter, first_file, file_count),
+                    "stats": _SessionColumn(stat_getter, first_file, file_count)
+                }
+                if flags & self.FLAG_LINKED:
+                    group["linked"] = True
+                else:
+                    group["algorithm"] = algorithm
+                groups.append(group)
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+        return groups
+
+    @classmethod
+    def save(cls, file_path, groups, target_dirs, options):
+        """Grupları oturum dosyasına yazar (geçici dosya + os.replace ile atomik). Stat anlık görüntüsü
+        olmayan dosyalar ("stats" yoksa) kayıt anında stat'lanır. Yazılan grup sayısını döndürür.
+        """
+        hash_algorithm = next((group["algorithm"] for group in groups if group.get("algorithm")), None)
+        meta = json.dumps({"options": options, "target_dirs": target_dirs, "hash_algorithm": hash_algorithm,
+                           "saved_at": time.strftime("%Y-%m-%d %H:%M:%S")}, ensure_ascii=False).encode('utf-8')
+        file_count = sum(len(group["files"]) for group in groups)
+        meta_offset = cls.HEADER.size
+        groups_offset = meta_offset + len(meta)
+        files_offset = groups_offset + len(groups) * cls.GROUP_RECORD.size
+        dirs_offset = files_offset + file_count * cls.FILE_RECORD.size
+
+        dir_ids = {}
+        strings_length = 0
+        temp_path = file_path + '.tmp'
+        with open(temp_path, 'wb') as file, tempfile.TemporaryFile() as strings:
+            def add_string(text):
+                nonlocal strings_length
+                data = text.encode('utf-8', 'surrogateescape')
+                strings.write(data)
+                strings_length += len(data)
+                return strings_length - len(data), len(data)
+
+            file.write(b'\0' * cls.HEADER.size + meta)
+            next_file = 0
+            group_records = []
+            for group in groups:
+                flags = cls.FLAG_LINKED if group.get("linked", False) else 0
+                group_records.append(cls.GROUP_RECORD.pack(group["size_bytes"], next_file, len(group["files"]), *add_string(group["hash"]), flags))
+                next_file += len(group["files"])
+            file.write(b''.join(group_records))
+            del group_records
+
+            for group in groups:
+                stats = group.get("stats")
+                for index, path in enumerate(group["files"]):
+                    stat_key = stats[index] if stats else None
+                    if stat_key is None:
+                        try:
+                            file_stats = os.stat(path)
+                            stat_key = (file_stats.st_dev, file_stats.st_ino, file_stats.st_size, file_stats.st_mtime_ns)
+                        except OSError:
+                            stat_key = (0, 0, 0, 0)
+                    dir_path, name = os.path.split(path)
+                    if dir_path not in dir_ids:
+                        dir_ids[dir_path] = len(dir_ids)
+                    file.write(cls.FILE_RECORD.pack(dir_ids[dir_path], *add_string(name), *stat_key))
+
+            file.write(b''.join(cls.DIR_RECORD.pack(*add_string(dir_path)) for dir_path in dir_ids))
+            strings.seek(0)
+            shutil.copyfileobj(strings, file)
+
+            file.seek(0)
+            file.write(cls.HEADER.pack(cls.MAGIC, meta_offset, len(meta), len(groups), file_count, len(dir_ids),
+                                       groups_offset, files_offset, dirs_offset))
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp_path, file_path)
+        return len(groups)
+
+class _SessionColumn:
+    """Oturum dosyasındaki ardışık dosya kayıtlarının bir sütununa (yol veya stat) salt okunur dizi görünümü."""
+    __slots__ = ("_getter", "_first", "_count")
+
+    def __init__(self, getter, first, count):
+        self._getter = getter
+        self._first = first
+        self._count = count
+
+    def __len__(self):
+        return self._count
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._count))]
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError(index)
+        return self._getter(self._first + index)
+
+    def __iter__(self):
+        for index in range(self._count):
+            yield self._getter(self._first + index)
+
+def find_changed_files(files_with_stats):
+    """[(yol, stat_anahtarı)] içinden taramadan (veya oturum kaydından) sonra değişen, silinen ya da
+    yerine başka dosya konan yolları döndürür. Stat anahtarı bilinmeyen (None) dosyalar değişmemiş sayılır.
+    """
+    changed_paths = []
+    for path, stat_key in files_with_stats:
+        if stat_key is None:
+            continue
+        try:
+            file_stats = os.stat(path)
+        except OSError:
+            changed_paths.append(path)
+            continue
+        if (file_stats.st_dev, file_stats.st_ino, file_stats.st_size, file_stats.st_mtime_ns) != tuple(stat_key):
+            changed_paths.append(path)
+    return changed_paths
+
+# MD5 neden gerekli: kullanıcı dosya adını değiştirdi ama içerik aynı. Bunu programın akıllı biçimde göstermesi gerekir. 
+
+class ScanEngine:
+    """Qt'ye bağımlı olmayan tarama çekirdeği: boyut -> ilk blok -> son blok -> tam hash elemesi ve
+    isteğe bağlı canlı izleme. Sonuçlar geri çağırmalarla bildirilir:
+    on_progress(yüzde), on_status(metin_anahtarı, *argümanlar), on_group(grup),
+    on_finished(sabit_bağ_grupları), on_group_updated(grup).
+    Durum iletileri dil dosyası anahtarlarıyla gelir; metne çevirmek arayüzün (GUI/CLI) işidir.
+    """
+
+    # Eleme aşamalarının tek ilerleme çubuğundaki payları (yüzde aralığı). Blok aşamaları dosya başına
+    # yalnızca birkaç KB okur; zamanın çoğu tam hash'te geçer.
+    PROGRESS_HEAD = (0, 10)
+    PROGRESS_TAIL = (10, 20)
+    PROGRESS_FULL = (20, 100)
+
+    def __init__(self, target_dirs, options, on_progress=None, on_status=None, on_group=None,
+                 on_finished=None, on_group_updated=None):
+        self.target_dirs = target_dirs
+        self.options = options
+        self.on_progress = on_progress or (lambda value: None)
+        self.on_status = on_status or (lambda key, *args: None)
+        self.on_group = on_group or (lambda group: None) # Son üyesi hash'lenen her kopya grubu anında gönderilir
+        self.on_finished = on_finished or (lambda groups: None) # Yalnızca on_group ile gönderilmemiş gruplar (sabit bağ grupları)
+        self.on_group_updated = on_group_updated or (lambda group: None) # İzleme kipinde üyeleri değişen grubun güncel hali (2'den az dosya = grup kalktı)
+        performance = options.get("performance", {})
+        self.hash_algorithm = resolve_hash_algorithm(performance.get("hash_algorithm", DEFAULT_HASH_ALGORITHM))
+        self.verify_bytes = performance.get("verify_bytes", False)
+        self.drop_page_cache = performance.get("drop_page_cache", False) # Okunan sayfalar sayfa önbelleğinde bırakılmaz
+        self.rate_limiter = RateLimiter()
+        self._throttle = None
+        if performance.get("adaptive_throttle", False):
+            self._throttle = LoadThrottle(performance.get("hash_workers", DEFAULT_HASH_WORKERS), self._throttle_changed)
+        self.set_rate_limits(performance.get("max_read_mb_per_second", 0), performance.get("max_files_per_second", 0))
+        self._is_running = True
+        self._table = None # Taranan dosyaların FileTable'ı; gruplar bu tablodaki indeksleri tutar
+        self._hash_cache = None
+        self._digests = {} # İzleme kipi: yol -> (stat anahtarı, eşleştirme seçenekleri uygulanmış hash)
+        self.watching = False
+
+    def set_rate_limits(self, read_mb_per_second, files_per_second):
+        """Okuma hızı (MB/s) ve dosya/s sınırlarını değiştirir; tarama sürerken de çağrılabilir. 0 = sınırsız."""
+        self.rate_limiter.set_limits(int(read_mb_per_second * 1024 * 1024), files_per_second)
+
+    def run(self):
+        performance = self.options.get("performance", {})
+        if performance.get("nice_level", 0) or performance.get("io_idle", False):
+            # Hash ve listeleme havuzları bu iş parçacığından açıldığı için öncelikleri onlara da geçer
+            lower_thread_priority(performance.get("nice_level", 0), performance.get("io_idle", False))
+        scan_state = self._scan()
+        self._table = None # İzleme kipi tablodan kendi dizinlerini kurar; tablo taramadan sonra tutulmaz
+        if scan_state and self.options.get("watch", False) and self._is_running:
+            self._watch(*scan_state)
+
+    def _scan(self):
+        """Tam tarama. Tamamlanırsa izleme kipinin devralacağı (dosya_filtresi, FileTable) döner,
+        iptal edilirse None.
+        """
+        # --- FİLTRELEME İŞLEMİNİN HAZIRLANMASI BAŞLANGICI ---
+        file_filters = self.options["filter"]
+        allowed_extensions = set()
+        custom_extensions_raw = file_filters.get("custom_extensions", "").strip()
+
+        selected_filter_key = "all"
+        filter_keys = ["audio", "video", "image", "text", "office", "pdf", "archive", "custom"]
+        if file_filters.get("all") == True:
+            selected_filter_key = "all"
+        else:
+            for key in filter_keys:
+                if file_filters.get(key) == True:
+                    selected_filter_key = key
+                    break
+        
+        if selected_filter_key != "all" and selected_filter_key != "custom":
+            allowed_extensions.update(EXTENSION_FILTERS.get(selected_filter_key, []))
+            
+        if selected_filter_key == "custom" and custom_extensions_raw:
+            for ext in custom_extensions_raw.lower().replace(" ", "").split(','):
+                if ext:
+                    if not ext.startswith('.'):
+                        ext = '.' + ext
+                    allowed_extensions.add(ext)
+
+        allowed_extensions = {ext.lower() for ext in allowed_extensions}
+        is_filtering_active = selected_filter_key != "all" and bool(allowed_extensions)
+        # --- FİLTRELEME İŞLEMİNİN HAZIRLANMASI SONU --- Buraya şimdilik ellemeyelim düzgün çalışıyor.
+
+        self.on_status("status_scanning")
+        table = FileTable()
+        self._table = table
+        # Sabit bağlar: (st_dev, st_ino) -> ilk yolun tablo indeksi (yalnızca st_nlink > 1 olanlar). Kardeş yolların
+        # listesi ancak aynı inode'a ikinci bir yol görülünce kurulur; kardeşi hiç görülmeyen dosya yalnızca bir int tutar.
+        linked_indexes = {}
+        linked_siblings = {} # tablo indeksi -> aynı inode'a bağlı diğer yollar
+
+        def accept_file(entry):
+            # Ada bağlı elemeler stat'tan önce yapılır; elenen dosya için hiç sistem çağrısı harcanmaz.
+            if self.options["ignore"]["ignore_system_hidden"] and entry.name.startswith('.'):
+                return False
+
+            # --- UZANTI FİLTRELEME UYGULAMASI ---
+            if is_filtering_active:
+                file_ext = os.path.splitext(entry.name)[1].lower()
+                if file_ext not in allowed_extensions:
+                    return False
+            # --- UZANTI FİLTRELEME UYGULAMASI SONU ---
+            return True
+
+        dir_index = None
+        if self.options.get("performance", {}).get("use_dir_index", True):
+            dir_index = DirectoryIndex(self.target_dirs)
+
+        scan_workers = self.options.get("performance", {}).get("scan_workers", DEFAULT_SCAN_WORKERS)
+        if scan_workers > 1:
+            file_entries = walk_files_parallel(self.target_dirs, scan_workers, accept_file, lambda: self._is_running, dir_index)
+        else:
+            file_entries = (entry for base_dir in self.target_dirs for entry in walk_files(base_dir, accept_file, dir_index))
+
+        for entry in file_entries:
+            if not self._is_running:
+                if dir_index:
+                    dir_index.save(self.target_dirs, completed=False)
+                return None
+
+            file_stats = entry.stat() # Listeleme sırasında önbelleğe alınmış tek stat
+            file_size = file_stats.st_size
+
+            if self.options["ignore"]["ignore_zero_byte"] and file_size == 0:
+                continue
+
+            # Sabit bağlar (hardlink): aynı inode yalnızca bir kez hash'lenir, kardeşleri ayrıca raporlanır
+            if file_stats.st_nlink > 1:
+                inode_key = (file_stats.st_dev, file_stats.st_ino)
+                first_index = linked_indexes.get(inode_key)
+                if first_index is not None:
+                    linked_siblings.setdefault(first_index, []).append(entry.path)
+                    continue
+                linked_indexes[inode_key] = table.add(os.path.dirname(entry.path), entry.name, file_stats)
+                continue
+
+            table.add(os.path.dirname(entry.path), entry.name, file_stats) # Kök dizinde ("/", "D:\\") ayırıcı korunur
+
+        if dir_index:
+            dir_index.save(self.target_dirs, completed=True)
+
+        total_files = len(table)
+        # Boyut kovaları yalnızca birden çok dosyası olan boyutlar için, indeks dizileri olarak kurulur
+        size_counts = Counter(table.sizes)
+        candidate_groups = {}
+        for index, file_size in enumerate(table.sizes):
+            if size_counts[file_size] > 1:
+                if file_size not in candidate_groups:
+                    candidate_groups[file_size] = array('Q')
+                candidate_groups[file_size].append(index)
+        del size_counts
+        total_candidates = sum(len(indexes) for indexes in candidate_groups.values())
+
+        linked_groups = []
+        del linked_indexes
+        for first_index, sibling_paths in linked_siblings.items():
+            file_paths = [table.path(first_index)] + sibling_paths
+            file_size_bytes = table.sizes[first_index]
+            linked_groups.append({
+                "hash": f"inode-{table.devs[first_index]}-{table.inodes[first_index]}",
+                "size_bytes": file_size_bytes,
+                "size": format_size(file_size_bytes),
+                "files": file_paths,
+                "stats": [table.stat_key(first_index)] * len(file_paths),
+                "linked": True # Zaten aynı veri; silmek yer kazandırmaz
+            })
+        del linked_siblings
+
+        if total_candidates == 0:
+            if linked_groups:
+                self.on_status("status_finished_linked", 0, len(linked_groups))
+            else:
+                self.on_status("status_finished_none", total_files)
+            self.on_finished(linked_groups)
+            return accept_file, table
+
+        # --- AŞAMALI ELEME: boyut -> ilk blok -> son blok -> tam hash ---
+        # Aynı boyuttaki dosyaların çoğu ilk bloklarında ayrışır; böylece dev dosyaları baştan sona okumayız.
+        self.on_status("status_prefiltering", total_candidates)
+        workers = self.options.get("performance", {}).get("hash_workers", DEFAULT_HASH_WORKERS)
+        self._scheduler = DeviceIOScheduler(workers, self._throttle)
+        if self.options.get("performance", {}).get("use_hash_cache", True):
+            self._hash_cache = HashCache(algorithm=self.hash_algorithm)
+
+        try:
+            candidate_groups = {(size,): indexes for size, indexes in candidate_groups.items()}
+
+            candidate_groups = self._split_groups(candidate_groups, self._head_digest, "head_hash",
+                                                  progress_span=self.PROGRESS_HEAD)
+            if candidate_groups is None: return None
+
+            candidate_groups = self._split_groups(candidate_groups, self._tail_digest, "tail_hash",
+                                                  progress_span=self.PROGRESS_TAIL)
+            if candidate_groups is None: return None
+
+            total_candidates = sum(len(indexes) for indexes in candidate_groups.values())
+            self.on_status("status_hashing", total_candidates)
+
+            found_count = 0
+            keep_digests = self.options.get("watch", False)
+            def emit_groups(key, results):
+                nonlocal found_count
+                if keep_digests:
+                    # İzleme kipi, dosya silindiğinde grubunu hash'lemeden bulabilsin
+                    for file_index, digest in results:
+                        if digest:
+                            file_path = table.path(file_index)
+                            self._digests[file_path] = (table.stat_key(file_index), self._apply_match_options(digest.hex(), file_path))
+                for group in self._build_final_groups(key[0], results):
+                    found_count += 1
+                    self.on_group(group)
+
+            # En büyük dosyalar önce hash'lenir; inceleme en çok yer kazandıracak gruplarla başlayabilsin
+            candidate_groups = dict(sorted(candidate_groups.items(), key=lambda item: item[0][0], reverse=True))
+            if self._split_groups(candidate_groups, self._full_digest, "full_hash", emit_groups,
+                                  progress_span=self.PROGRESS_FULL, report_files=True) is None: return None
+
+            if self._hash_cache:
+                self._hash_cache.evict_stale()
+        finally:
+            if self._hash_cache:
+                self._hash_cache.close()
+                self._hash_cache = None
+
+        if linked_groups:
+            self.on_status("status_finished_linked", found_count, len(linked_groups))
+        else:
+            self.on_status("status_finished", found_count)
+
+        self.on_progress(100)
+        self.on_finished(linked_groups)
+        return accept_file, table
+
+    # --- CANLI İZLEME KİPİ ---
+
+    def _watch(self, accept_file, table):
+        """Taramadan sonra hedef dizinleri inotify ile izler; yeni/değişen dosyaları hash'leyip grupları
+        yerinde günceller (group_updated). Tam yeniden tarama gerekmez. stop() ile sonlanır.
+        Taramanın dosya tablosundan boyut kovaları kurulur; bir dosyanın tam hash'i yalnızca aynı boyutta
+        başka bir dosya varsa hesaplanır.
+        Bilinen bir bedel: izleme kipinde kovalar tam yol dizeleri tutar (olay yolları tabloya eşlenemez), yani
+        FileTable'ın bellek kazancı izleme süresince geçerli değildir; bellek taranan dosya sayısıyla büyür.
+        """
+        watcher = InotifyWatcher()
+        if not watcher.available:
+            self.on_status("status_watch_unavailable")
+            return
+
+        self.watching = True
+        self._accept_file = accept_file
+        self._size_index = {}
+        self._path_sizes = {}
+        for file_index, file_size in enumerate(table.sizes):
+            file_path = table.path(file_index)
+            self._size_index.setdefault(file_size, []).append(file_path)
+            self._path_sizes[file_path] = file_size
+        self._table = None
+        if self.options.get("performance", {}).get("use_hash_cache", True):
+            self._hash_cache = HashCache(algorithm=self.hash_algorithm)
+
+        try:
+            for base_dir in self.target_dirs:
+                watcher.add_tree(base_dir)
+            self.on_status("status_watching", len(self.target_dirs))
+
+            while self._is_running:
+                events, overflowed = watcher.read_events(timeout=0.5)
+                if overflowed:
+                    self.on_status("status_watch_overflow")
+
+                # Olaylar toplu işlenir: aynı dosyanın art arda gelen olayları tek işe iner
+                changed_paths = {}
+                removed_paths = set()
+                for dir_path, name, mask in events:
+                    path = os.path.join(dir_path, name)
+                    if mask & InotifyWatcher.IN_ISDIR:
+                        if mask & (InotifyWatcher.IN_CREATE | InotifyWatcher.IN_MOVED_TO):
+                            watcher.add_tree(path)
+                            for entry in walk_files(path, accept_file):
+                                changed_paths[entry.path] = None
+                                removed_paths.discard(entry.path)
+                        elif mask & (InotifyWatcher.IN_MOVED_FROM | InotifyWatcher.IN_DELETE):
+                            watcher.remove_tree(path)
+                            prefix = os.path.join(path, '')
+                            for known_path in [p for p in self._path_sizes if p.startswith(prefix)]:
+                                removed_paths.add(known_path)
+                                changed_paths.pop(known_path, None)
+                    elif mask & (InotifyWatcher.IN_CLOSE_WRITE | InotifyWatcher.IN_MOVED_TO):
+                        changed_paths[path] = None
+                        removed_paths.discard(path)
+                    elif mask & (InotifyWatcher.IN_DELETE | InotifyWatcher.IN_MOVED_FROM):
+                        removed_paths.add(path)
+                        changed_paths.pop(path, None)
+
+                for path in removed_paths:
+                    self._forget_watched_file(path)
+                for path in changed_paths:
+                    while self._is_running and self._throttle and self._throttle.update() == 0:
+                        time.sleep(LoadThrottle.SAMPLE_INTERVAL) # Sunucu meşgul; değişiklikler yük kalkınca hash'lenir
+                    if not self._is_running:
+                        break
+                    self._watched_file_changed(path)
+        finally:
+            watcher.close()
+            if self._hash_cache:
+                self._hash_cache.close()
+                self._hash_cache = None
+            self.watching = False
+
+    def _watched_file_changed(self, file_path):
+        if not self._accept_file(CachedDirEntry(os.path.dirname(file_path), os.path.basename(file_path), None)):
+            return
+        self._forget_watched_file(file_path)
+        try:
+            file_stats = os.stat(file_path)
+        except OSError:
+            return
+        file_size = file_stats.st_size
+        if not stat.S_ISREG(file_stats.st_mode) or (self.options["ignore"]["ignore_zero_byte"] and file_size == 0):
+            return
+
+        same_size_paths = self._size_index.setdefault(file_size, [])
+        same_size_paths.append(file_path)
+        self._path_sizes[file_path] = file_size
+        if len(same_size_paths) < 2:
+            return
+
+        file_hash = self._watched_digest(file_path)
+        if file_hash is None:
+            return
+        for other_path in same_size_paths[:-1]:
+            self._watched_digest(other_path)
+
+        if self.verify_bytes:
+            peer_path = next((path for path in same_size_paths[:-1]
+                              if path in self._digests and self._digests[path][1] == file_hash), None)
+            if peer_path and not files_identical(peer_path, file_path, drop_cache=self.drop_page_cache, limiter=self.rate_limiter):
+                # Hash çakışması: dosya tek başına kalsın diye anahtarı kendine özgü yapılır
+                self._digests[file_path] = (self._digests[file_path][0], f"{file_hash}-{file_path}")
+                return
+
+        group = self._emit_watched_group(file_size, file_hash)
+        if len(group["files"]) > 1:
+            self.on_status("status_watch_new_duplicate", os.path.basename(file_path))
+
+    def _forget_watched_file(self, file_path):
+        file_size = self._path_sizes.pop(file_path, None)
+        if file_size is None:
+            return
+        same_size_paths = self._size_index[file_size]
+        same_size_paths.remove(file_path)
+        if not same_size_paths:
+            del self._size_index[file_size]
+        digest_entry = self._digests.pop(file_path, None)
+        if digest_entry:
+            self._emit_watched_group(file_size, digest_entry[1])
+
+    def _watched_digest(self, file_path):
+        """Dosyanın (eşleştirme seçenekleri uygulanmış) tam hash'ini döndürür; dosya değişmediyse bellekten
+        veya hash önbelleğinden alır. Okunamazsa None.
+        """
+        try:
+            file_stats = os.stat(file_path)
+        except OSError:
+            return None
+        stat_key = (file_stats.st_dev, file_stats.st_ino, file_stats.st_size, file_stats.st_mtime_ns)
+        digest_entry = self._digests.get(file_path)
+        if digest_entry and digest_entry[0] == stat_key:
+            return digest_entry[1]
+
+        digest = None
+        if self._hash_cache:
+            digest = self._hash_cache.lookup("full_hash", {stat_key}).get(stat_key)
+        if digest is None:
+            self.on_status("status_hashing_file", os.path.basename(file_path))
+            raw_digest = calculate_digest(file_path, self.hash_algorithm, drop_cache=self.drop_page_cache, limiter=self.rate_limiter)
+            if not raw_digest:
+                return None
+            digest = raw_digest.hex()
+            if self._hash_cache:
+                self._hash_cache.store("full_hash", [(stat_key, file_path, digest)])
+
+        file_hash = self._apply_match_options(digest, file_path)
+        self._digests[file_path] = (stat_key, file_hash)
+        return file_hash
+
+    def _emit_watched_group(self, file_size, file_hash):
+        file_paths = [path for path in self._size_index.get(file_size, [])
+                      if path in self._digests and self._digests[path][1] == file_hash]
+        group = {
+            "hash": file_hash,
+            "algorithm": self.hash_algorithm,
+            "size_bytes": file_size,
+            "size": format_size(file_size),
+            "files": file_paths,
+            "stats": [self._digests[path][0] for path in file_paths]
+        }
+        self.on_group_updated(group)
+        return group
+
+    def _build_final_groups(self, file_size_bytes, results):
+        """Bir aday grubunun (dosya_indeksi, tam_digest) sonuçlarından sonuç gruplarını kurar.
+        Ad/uzantı eşleştirmesi seçiliyse içerik grupları bunlara göre yeniden bölünür; bayt doğrulaması
+        açıksa gruplar gönderilmeden önce doğrulanır.
+        """
+        files_by_hash = {}
+        for file_index, digest in results:
+            if not digest:
+                continue
+            file_path = self._table.path(file_index)
+            file_hash = self._apply_match_options(digest.hex(), file_path)
+            if file_hash not in files_by_hash:
+                files_by_hash[file_hash] = []
+            files_by_hash[file_hash].append((file_path, file_index))
+
+        final_groups = []
+        for file_hash, members in files_by_hash.items():
+            if len(members) > 1:
+                final_groups.append({
+                    "hash": file_hash,
+                    "algorithm": self.hash_algorithm,
+                    "size_bytes": file_size_bytes,
+                    "size": format_size(file_size_bytes),
+                    "files": [file_path for file_path, file_index in members],
+                    "stats": [self._table.stat_key(file_index) for file_path, file_index in members] # Silmeden önce yeniden doğrulamak için
+                })
+        if self.verify_bytes:
+            final_groups = [verified for group in final_groups for verified in self._verify_group(group)]
+        return final_groups
+
+    def _verify_group(self, group):
+        """Hash'i aynı çıkan dosyaları bayt bayt karşılaştırıp gerçekten özdeş olanların alt gruplarına böler.
+        Olağan durumda (çakışma yok) grup aynen döner; her dosya yalnızca kendi parçasının ilk dosyasıyla karşılaştırılır.
+        """
+        self.on_status("status_verifying_file", os.path.basename(group["files"][0]))
+        parts = [] # (temsilci yol, üye sıraları)
+        for position, file_path in enumerate(group["files"]):
+            for representative, positions in parts:
+                if files_identical(representative, file_path, drop_cache=self.drop_page_cache, limiter=self.rate_limiter):
+                    positions.append(position)
+                    break
+            else:
+                parts.append((file_path, [position]))
+
+        verified_groups = []
+        for part_number, (representative, positions) in enumerate(parts):
+            if len(positions) > 1:
+                verified_groups.append(dict(
+                    group,
+                    hash=group["hash"] if part_number == 0 else f"{group['hash']}-{part_number}",
+                    files=[group["files"][position] for position in positions],
+                    stats=[group["stats"][position] for position in positions]
+                ))
+        return verified_groups
+
+    def _split_groups(self, groups, digest_func, cache_column, on_group_done=None, progress_span=(0, 100), report_files=False):
+        """Her aday grubunu digest_func sonucuna göre alt gruplara böler, tek kalan dosyaları eler.
+        Gruplar FileTable indekslerinin dizileridir; anahtarlar (boyut, ilk_blok, son_blok, ...) biçiminde
+        ham (bytes) digest'lerle büyür. İptal edilirse None döner.
+        digest_func(dosya_indeksi, anahtar) çağrıları DeviceIOScheduler üzerinden aygıt bazlı paralel yürür;
+        sonuçlar sıra numarasıyla saklanıp sonra toplanır, böylece grup içindeki dosya sırası (ve korunacak
+        ilk dosya) tek iş parçacıklı taramayla aynı kalır.
+        Hash önbelleğinde (cache_column sütununda, onaltılık metin) karşılığı bulunan dosyalar hiç okunmaz.
+        on_group_done verilirse, bir aday grubunun son üyesi biter bitmez
+        on_group_done(anahtar, [(dosya_indeksi, digest), ...]) çağrılır (sonuçların akışla gönderimi için).
+        İlerleme, aşamanın genel çubuktaki payı olan progress_span aralığında ve yalnızca değer değiştikçe
+        bildirilir; dosya başına durum iletisi yalnızca report_files ile (tam hash aşamasında) gönderilir.
+        """
+        table = self._table
+        # Girdi başına demet yerine iki paralel sütun: anahtar referansı ve dosya indeksi
+        entry_keys = []
+        entry_files = array('Q')
+        for key, file_indexes in groups.items():
+            entry_keys.extend([key] * len(file_indexes))
+            entry_files.extend(file_indexes)
+        total = len(entry_files)
+        digests = [None] * total
+
+        if self._hash_cache:
+            cached = self._hash_cache.lookup(cache_column, {table.stat_key(file_index) for file_index in entry_files})
+            for index, file_index in enumerate(entry_files):
+                cached_digest = cached.get(table.stat_key(file_index))
+                if cached_digest:
+                    digests[index] = bytes.fromhex(cached_digest)
+            del cached
+
+        pending_indexes = array('Q', (index for index in range(total) if digests[index] is None))
+        processed_count = total - len(pending_indexes)
+
+        indexes_by_key = {}
+        remaining_by_key = {}
+        if on_group_done:
+            for index, key in enumerate(entry_keys):
+                if key not in indexes_by_key:
+                    indexes_by_key[key] = []
+                indexes_by_key[key].append(index)
+            for index in pending_indexes:
+                key = entry_keys[index]
+                remaining_by_key[key] = remaining_by_key.get(key, 0) + 1
+
+        def finish_group(key):
+            on_group_done(key, [(entry_files[index], digests[index]) for index in indexes_by_key[key]])
+
+        # Tüm üyeleri önbellekten gelen gruplar beklemeden tamamlanır
+        for key in indexes_by_key:
+            if key not in remaining_by_key:
+                finish_group(key)
+
+        span_start, span_end = progress_span
+        last_percent = None
+        def report_progress():
+            nonlocal last_percent
+            percent = span_start + (span_end - span_start) * processed_count // total if total else span_end
+            if percent != last_percent:
+                last_percent = percent
+                self.on_progress(percent)
+        report_progress() # Önbellekten gelenler dahil aşamanın başlangıç değeri
+
+        def on_job_result(job_index, digest):
+            nonlocal processed_count
+            index = pending_indexes[job_index]
+            processed_count += 1
+            digests[index] = digest
+            report_progress()
+            if report_files:
+                self.on_status("status_hashing_file", os.path.basename(table.path(entry_files[index])))
+
+            if on_group_done:
+                key = entry_keys[index]
+                remaining_by_key[key] -= 1
+                if remaining_by_key[key] == 0:
+                    finish_group(key)
+
+        jobs = [(table.devs[entry_files[index]], (entry_files[index], entry_keys[index])) for index in pending_indexes]
+        if not self._scheduler.run(jobs, digest_func, on_job_result, lambda: self._is_running):
+            return None
+        del jobs
+
+        if self._hash_cache:
+            # Önbellekten gelenler de yazılır ki son görülme zamanları tazelensin ve temizlikte silinmesinler
+            self._hash_cache.store(cache_column, (
+                (table.stat_key(file_index), table.path(file_index), digest.hex())
+                for file_index, digest in zip(entry_files, digests) if digest
+            ))
+
+        new_groups = {}
+        for key, file_index, digest in zip(entry_keys, entry_files, digests):
+            if not digest:
+                continue
+
+            new_key = key + (digest,)
+            if new_key not in new_groups:
+                new_groups[new_key] = array('Q')
+            new_groups[new_key].append(file_index)
+
+        return {key: file_indexes for key, file_indexes in new_groups.items() if len(file_indexes) > 1}
+
+    def _head_digest(self, file_index, key):
+        return calculate_block_digest(self._table.path(file_index), self.hash_algorithm, drop_cache=self.drop_page_cache,
+                                      limiter=self.rate_limiter)
+
+    def _tail_digest(self, file_index, key):
+        # Tek bloğa sığan dosyaların son bloğu zaten ilk bloğun kendisidir.
+        if key[0] <= PARTIAL_HASH_BLOCK:
+            return key[1]
+        return calculate_block_digest(self._table.path(file_index), self.hash_algorithm, from_end=True,
+                                      drop_cache=self.drop_page_cache, limiter=self.rate_limiter)
+
+    def _full_digest(self, file_index, key):
+        if key[0] <= PARTIAL_HASH_BLOCK:
+            return key[1] # İlk bloğun özeti zaten dosyanın tam özetidir
+        chunk_size = self._scheduler.read_chunk_size(self._table.devs[file_index])
+        return calculate_digest(self._table.path(file_index), self.hash_algorithm, chunk_size, self.drop_page_cache,
+                                self.rate_limiter)
+
+    def _apply_match_options(self, file_hash, file_path):
+        """Ad/uzantı eşleştirme seçeneklerine göre hash anahtarına dosya adı veya uzantı ekler."""
+        if self.options["match"]["name"]:
+            file_hash = f"{file_hash}-{os.path.basename(file_path)}"
+
+        if self.options["match"]["extension"]:
+            file_name, file_ext = os.path.splitext(os.path.basename(file_path))
+            file_hash = f"{file_hash}-{file_ext.lower()}"
+
+        return file_hash
+
+    def _throttle_changed(self, concurrency):
+        if concurrency == 0:
+            self.on_status("status_throttle_paused")
+        else:
+            self.on_status("status_throttle_level", concurrency, self._throttle.max_concurrency)
+
+    def stop(self):
+        self._is_running = False
+        self.rate_limiter.cancel() # Hız sınırı yüzünden bekleyen okumalar durdurmayı geciktirmesin
+
+
+# ----------------------------------------------------------------------
+# KOMUT SATIRI (ekransız sunucular ve cron için)
+# ----------------------------------------------------------------------
+
+def _load_cli_texts(language):
+    """Durum iletileri için GUI'nin kullandığı dil dosyasını (languages/<language>.ini) okur.
+    GUI'deki get_text gibi English.ini taban alınır; seçili dilde eksik anahtarlar İngilizce görünür.
+    """
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    possible_paths = [
+        script_dir,
+        os.path.join(script_dir, 'languages'),
+        os.path.join(script_dir, 'lang'),
+        '/usr/share/DuplicateAgent/lang',
+        os.path.expanduser('~/.duplicateagent/lang')
+    ]
+
+    def read_language(name):
+        for path in possible_paths:
+            lang_path = os.path.join(path, f"{name}.ini")
+            if os.path.exists(lang_path):
+                config = configparser.ConfigParser()
+                try:
+                    config.read(lang_path, encoding='utf-8')
+                except configparser.Error as e:
+                    print(f"HATA: Dil dosyası okunamadı: {lang_path} - {e}", file=sys.stderr)
+                    continue
+                return {key: value for section in config.sections() for key, value in config.items(section)}
+        return {}
+
+    texts = read_language("English")
+    if language != "English":
+        texts.update(read_language(language))
+    return texts
+
+def build_cli_options(args):
+    """argparse sonucunu GUI'nin WorkerThread'e verdiği seçenek sözlüğüne çevirir."""
+    filter_options = {key: False for key in EXTENSION_FILTERS}
+    if args.extensions:
+        filter_options["custom"] = True
+    else:
+        filter_options[args.filter] = True
+    filter_options["custom_extensions"] = args.extensions or ""
+
+    return {
+        "match": {"content": True, "size": True, "name": args.match_name, "extension": args.match_extension},
+        "ignore": {"ignore_zero_byte": not args.include_empty, "ignore_system_hidden": not args.include_hidden},
+        "filter": filter_options,
+        "performance": {
+            "hash_workers": args.hash_workers,
+            "scan_workers": args.scan_workers,
+            "use_hash_cache": not args.no_hash_cache,
+            "use_dir_index": not args.no_dir_index,
+            "hash_algorithm": args.hash_algorithm,
+            "verify_bytes": args.verify,
+            "drop_page_cache": args.drop_page_cache,
+            "max_read_mb_per_second": args.max_read_rate,
+            "max_files_per_second": args.max_file_rate,
+            "io_idle": args.ionice_idle,
+            "nice_level": args.nice,
+            "adaptive_throttle": args.adaptive,
+        },
+        "watch": args.watch,
+    }
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="duplicateagent_engine",
+        description="Duplicate Agent headless scan: finds duplicate files without the Qt GUI."
+    )
+    parser.add_argument("roots", nargs="+", help="directories to scan")
+    parser.add_argument("--match-name", action="store_true", help="also require identical file names")
+    parser.add_argument("--match-extension", action="store_true", help="also require identical extensions")
+    parser.add_argument("--include-empty", action="store_true", help="do not skip zero-byte files")
+    parser.add_argument("--include-hidden", action="store_true", help="do not skip hidden (dot) files")
+    parser.add_argument("--filter", choices=[key for key in EXTENSION_FILTERS if key != "custom"], default="all",
+                        help="only scan one file category")
+    parser.add_argument("--extensions", help="comma separated extensions to scan (e.g. jpg,png); overrides --filter")
+    parser.add_argument("--hash-workers", type=int, default=DEFAULT_HASH_WORKERS)
+    parser.add_argument("--scan-workers", type=int, default=DEFAULT_SCAN_WORKERS)
+    # "fast" betiklerde xxhash olmayan makinede de kabul edilir ve varsayılana düşer (bkz. resolve_hash_algorithm)
+    parser.add_argument("--hash-algorithm", choices=sorted({"fast", *HASH_ALGORITHM_CHOICES}), default=DEFAULT_HASH_ALGORITHM,
+                        help="content hash; fast = xxh3_128, or sha1 when xxhash is not installed (default: %(default)s)")
+    parser.add_argument("--verify", action="store_true",
+                        help="byte-compare the files of every group before reporting it")
+    parser.add_argument("--drop-page-cache", action="store_true",
+                        help="evict file pages from the OS page cache right after hashing them (shared production hosts)")
+    parser.add_argument("--max-read-rate", type=float, default=0, metavar="MB_PER_S",
+                        help="cap the hashing read rate in MB/s (0 = unlimited)")
+    parser.add_argument("--max-file-rate", type=float, default=0, metavar="FILES_PER_S",
+                        help="cap the number of files opened for hashing per second (0 = unlimited)")
+    parser.add_argument("--ionice-idle", action="store_true", help="read with the idle I/O scheduling class (like ionice -c3)")
+    parser.add_argument("--nice", type=int, default=0, choices=range(0, 20), metavar="0-19", help="nice level of the scan")
+    parser.add_argument("--adaptive", action="store_true",
+                        help="adjust hashing concurrency to CPU use (/proc/stat) and I/O pressure (/proc/pressure/io); pause while the host is busy")
+    parser.add_argument("--no-hash-cache", action="store_true", help="do not read or write ~/.duplicateagent/hashcache.db")
+    parser.add_argument("--no-dir-index", action="store_true", help="do not reuse listings of unchanged directories")
+    parser.add_argument("--watch", action="store_true", help="keep watching the roots after the scan (Linux inotify)")
+    parser.add_argument("--format", choices=GroupExporter.FORMATS, default="text",
+                        help="result format; jsonl and csv write one group / one file per line")
+    parser.add_argument("--output", help="write results to this file instead of stdout")
+    parser.add_argument("--save-session", help="also save the results as a session file the GUI can open for review")
+    parser.add_argument("--language", default="English", help="language file for status messages (e.g. Turkish)")
+    parser.add_argument("-q", "--quiet", action="store_true", help="no status messages on stderr")
+    parser.add_argument("-v", "--verbose", action="store_true", help="also report every file being hashed")
+    args = parser.parse_args(argv)
+
+    roots = [os.path.abspath(root) for root in args.roots]
+    for root in roots:
+        if not os.path.isdir(root):
+            parser.error(f"not a directory: {root}")
+
+    texts = _load_cli_texts(args.language)
+
+    def on_status(key, *params):
+        if args.quiet or (key in ("status_hashing_file", "status_verifying_file") and not args.verbose):
+            return
+        print(texts.get(key, key).format(*params), file=sys.stderr, flush=True)
+
+    exporter = GroupExporter(args.output or sys.stdout, args.format, flush_each=args.watch)
+    options = build_cli_options(args)
+    session_groups = []
+
+    def on_group(group):
+        exporter.write_group(group)
+        if args.save_session:
+            session_groups.append(group) # Oturum dosyası grup sayısını baştan bilmek zorunda
+
+    def on_finished(groups):
+        for group in groups:
+            on_group(group)
+        if args.save_session:
+            try:
+                ScanSession.save(args.save_session, session_groups, roots, options)
+            except OSError as e:
+                print(f"HATA: Oturum dosyası yazılamadı: {e}", file=sys.stderr)
+
+    engine = ScanEngine(
+        roots, options,
+        on_status=on_status,
+        on_group=on_group,
+        on_finished=on_finished,
+        on_group_updated=lambda group: exporter.write_group(dict(group, updated=True))
+    )
+
+    interrupted = False
+    def handle_signal(signum, frame):
+        nonlocal interrupted
+        interrupted = not engine.watching # İzleme kipinde sinyal normal çıkıştır
+        engine.stop()
+    signal.signal(signal.SIGINT, handle_signal)
+    signal.signal(signal.SIGTERM, handle_signal)
+
+    try:
+        engine.run()
+    finally:
+        exporter.close()
+
+    return 130 if interrupted else 0
+
+if __name__ == "__main__":
+    sys.exit(main())